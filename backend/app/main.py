@@ -110,11 +110,12 @@ app.include_router(charts.router, prefix="/api/charts", tags=["Charts"])
 app.include_router(goals.router, prefix="/api/goals", tags=["Goals"])
 
 
-@app.get("/")
+@app.api_route("/", methods=["GET", "HEAD"])
 def root():
     """
     Root endpoint - API health check.
     Returns a welcome message and link to docs.
+    Also answers HEAD so the frontend can probe it without a body.
     """
     return {
         "message": "FitTrack Pro API",
@@ -21,6 +21,52 @@ from app.schemas.user import UserRead
 router = APIRouter()
 
 
+# Health data categories: response key -> (model, date column)
+_HEALTH_DATA_MODELS = {
+    "workouts": (Workout, Workout.workout_date),
+    "meals": (Meal, Meal.meal_date),
+    "sleep_records": (SleepRecord, SleepRecord.sleep_date),
+    "water_intakes": (WaterIntake, WaterIntake.intake_date),
+    "weight_logs": (WeightLog, WeightLog.log_date),
+}
+
+
+def _to_dict(obj):
+    """Convert SQLAlchemy model to dict."""
+    result = {}
+    for column in obj.__table__.columns:
+        value = getattr(obj, column.name)
+        if isinstance(value, date):
+            result[column.name] = value.isoformat()
+        else:
+            result[column.name] = value
+    return result
+
+
+def _get_user_or_404(db: Session, user_id: int) -> User:
+    """Fetch a user by ID or raise 404."""
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found"
+        )
+    return user
+
+
+def _user_info(user: User) -> dict:
+    """Public user fields included in health data responses."""
+    return {
+        "id": user.id,
+        "unique_user_id": user.unique_user_id,
+        "username": user.username,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "role": user.role
+    }
+
+
 @router.get("/users", response_model=List[UserRead])
 def search_users(
     q: str = Query(..., min_length=1, description="Search query (ID, name, or email)"),
@@ -83,12 +129,7 @@ def get_user_health_data(
     Returns workouts, meals, sleep records, water intakes, and weight logs.
     """
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with id {user_id} not found"
-        )
+    user = _get_user_or_404(db, user_id)
     
     # Build queries with optional date filtering
     workouts_query = db.query(Workout).filter(Workout.user_id == user_id)
@@ -119,38 +160,18 @@ def get_user_health_data(
     water_intakes = water_query.order_by(WaterIntake.intake_date.desc()).all()
     weight_logs = weight_query.order_by(WeightLog.log_date.desc()).all()
     
-    # Convert to dictionaries for JSON response
-    def to_dict(obj):
-        """Convert SQLAlchemy model to dict."""
-        result = {}
-        for column in obj.__table__.columns:
-            value = getattr(obj, column.name)
-            if isinstance(value, date):
-                result[column.name] = value.isoformat()
-            else:
-                result[column.name] = value
-        return result
-    
     return {
-        "user": {
-            "id": user.id,
-            "unique_user_id": user.unique_user_id,
-            "username": user.username,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "role": user.role
-        },
+        "user": _user_info(user),
         "filters": {
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None
         },
         "data": {
-            "workouts": [to_dict(w) for w in workouts],
-            "meals": [to_dict(m) for m in meals],
-            "sleep_records": [to_dict(s) for s in sleep_records],
-            "water_intakes": [to_dict(w) for w in water_intakes],
-            "weight_logs": [to_dict(w) for w in weight_logs]
+            "workouts": [_to_dict(w) for w in workouts],
+            "meals": [_to_dict(m) for m in meals],
+            "sleep_records": [_to_dict(s) for s in sleep_records],
+            "water_intakes": [_to_dict(w) for w in water_intakes],
+            "weight_logs": [_to_dict(w) for w in weight_logs]
         },
         "counts": {
             "workouts": len(workouts),
@@ -160,3 +181,71 @@ def get_user_health_data(
             "weight_logs": len(weight_logs)
         }
     }
+
+
+@router.get("/user/{user_id}/summary")
+def get_user_health_summary(
+    user_id: int,
+    limit: int = Query(5, ge=1, le=50, description="Recent records to return per category"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a compact health data summary for a specific user.
+    
+    - **user_id**: User's database ID
+    - **limit**: Number of most recent records returned per category
+    
+    Returns the latest records per category, total counts, and pre-aggregated
+    chart data (workout type counts, weight and sleep time series) so the
+    admin view does not need the full history.
+    """
+    user = _get_user_or_404(db, user_id)
+    
+    recent = {}
+    counts = {}
+    for key, (model, date_column) in _HEALTH_DATA_MODELS.items():
+        rows = (
+            db.query(model)
+            .filter(model.user_id == user_id)
+            .order_by(date_column.desc())
+            .limit(limit)
+            .all()
+        )
+        recent[key] = [_to_dict(row) for row in rows]
+        counts[key] = db.query(func.count(model.id)).filter(model.user_id == user_id).scalar()
+    
+    workout_types = (
+        db.query(Workout.workout_type, func.count(Workout.id))
+        .filter(Workout.user_id == user_id)
+        .group_by(Workout.workout_type)
+        .all()
+    )
+    weight_trend = (
+        db.query(WeightLog.log_date, WeightLog.weight_kg)
+        .filter(WeightLog.user_id == user_id)
+        .order_by(WeightLog.log_date)
+        .all()
+    )
+    sleep_trend = (
+        db.query(SleepRecord.sleep_date, SleepRecord.total_hours)
+        .filter(SleepRecord.user_id == user_id)
+        .order_by(SleepRecord.sleep_date)
+        .all()
+    )
+    
+    return {
+        "user": _user_info(user),
+        "recent": recent,
+        "counts": counts,
+        "charts": {
+            "workout_types": {workout_type: count for workout_type, count in workout_types},
+            "weight_trend": {
+                "dates": [d.isoformat() for d, _ in weight_trend],
+                "weight_kg": [w for _, w in weight_trend]
+            },
+            "sleep_trend": {
+                "dates": [d.isoformat() for d, _ in sleep_trend],
+                "total_hours": [h for _, h in sleep_trend]
+            }
+        }
+    }
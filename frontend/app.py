@@ -5,9 +5,128 @@ Frontend dashboard for Health & Fitness Monitor.
 
 from dash import Dash, html, dcc, callback, Output, Input, State, clientside_callback
 import dash_bootstrap_components as dbc
+from decimal import Decimal
+import atexit
+import gzip
+import hashlib
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import flask
+from flask.json.provider import DefaultJSONProvider
+import numpy as np
+import plotly.io as pio
+
+# orjson is an optional speedup for serializing callback responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """Serialize the non-JSON types that show up in figures and layouts."""
+    if hasattr(obj, 'to_plotly_json'):
+        return obj.to_plotly_json()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=_json_default
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Response compression for the layout and callback JSON
+COMPRESS_MIMETYPES = ("application/json", "text/html", "text/css", "application/javascript")
+COMPRESS_LEVEL = 6
+COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies aren't worth the CPU
+
+
+def _gzip_response(response):
+    """Gzip compressible responses when the client accepts it."""
+    if (
+        "gzip" not in flask.request.headers.get("Accept-Encoding", "").lower()
+        or response.direct_passthrough
+        or not 200 <= response.status_code < 300
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+    ):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+class HealthDash(Dash):
+    """
+    Dash app that gzips its responses, serves its static layout from
+    pre-serialized bytes and serializes with orjson when it is installed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (layout inputs, JSON body, ETag) of the last serialized layout
+        self._layout_blob = None
+        self.server.after_request(_gzip_response)
+        if orjson is not None:
+            # Callback responses and figures go through plotly's JSON engine,
+            # everything Flask serializes through the app's JSON provider
+            pio.json.config.default_engine = "orjson"
+            self.server.json = OrjsonProvider(self.server)
+    
+    def serve_layout(self):
+        """
+        Serve /_dash-layout from bytes serialized once per layout.
+        
+        The shell layout is user-independent (pages are routed in through
+        display_page), so every request gets the same body; clients
+        revalidate with the ETag and get a 304 when it hasn't changed.
+        """
+        layout = self.layout
+        if callable(layout):
+            return super().serve_layout()
+        
+        # _layout_value() adds extra components (pages, background callbacks)
+        # and builds a new wrapper each call, so the blob is keyed on its
+        # inputs: the layout object and the extra components
+        source = (layout, tuple(getattr(self, "_extra_components", ())))
+        if self._layout_blob is None or self._layout_blob[0] != source:
+            body = pio.json.to_json_plotly(self._layout_value()).encode()
+            etag = hashlib.sha1(body).hexdigest()
+            self._layout_blob = (source, body, etag)
+        _, body, etag = self._layout_blob
+        
+        response = flask.Response(body, mimetype="application/json")
+        # Weak, since _gzip_response may re-encode the same representation
+        response.set_etag(etag, weak=True)
+        # Revalidate each load so a redeploy's new layout is picked up at once
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(flask.request)
+
 
 # Initialize Dash app with Bootstrap theme
-app = Dash(
+app = HealthDash(
     __name__,
     external_stylesheets=[dbc.themes.BOOTSTRAP],
     suppress_callback_exceptions=True,
@@ -700,7 +819,7 @@ def create_api_docs_layout(auth_data):
 
 def create_admin_search_layout(auth_data):
     """Create admin user search page with prominent unique ID display."""
-    from services.api_client import get_users, search_users, get_user_health_data
+    from services.api_client import get_users, search_users
     
     username = auth_data.get('username', 'Admin') if auth_data else 'Admin'
     
@@ -797,7 +916,10 @@ def create_admin_search_layout(auth_data):
 
 def create_admin_overview_layout(auth_data):
     """Create admin overview dashboard with aggregated data from ALL users."""
-    from services.api_client import get_users, get_workouts, get_meals, get_weight_logs, get_sleep_records, get_water_intakes
+    from services.api_client import (
+        get_users, get_workouts, get_meals, get_weight_logs, get_sleep_records, get_water_intakes,
+        fetch_concurrently
+    )
     import plotly.express as px
     import plotly.graph_objects as go
     import pandas as pd
@@ -805,13 +927,21 @@ def create_admin_overview_layout(auth_data):
     
     username = auth_data.get('username', 'Admin') if auth_data else 'Admin'
     
-    # Fetch all data (no user_id filter = all users)
-    users = get_users() or []
-    workouts = get_workouts() or []
-    meals = get_meals() or []
-    weight_logs = get_weight_logs() or []
-    sleep_records = get_sleep_records() or []
-    water_intakes = get_water_intakes() or []
+    # Fetch all data (no user_id filter = all users), all six requests at once
+    data = fetch_concurrently({
+        'users': get_users,
+        'workouts': get_workouts,
+        'meals': get_meals,
+        'weight_logs': get_weight_logs,
+        'sleep_records': get_sleep_records,
+        'water_intakes': get_water_intakes,
+    })
+    users = data['users'] or []
+    workouts = data['workouts'] or []
+    meals = data['meals'] or []
+    weight_logs = data['weight_logs'] or []
+    sleep_records = data['sleep_records'] or []
+    water_intakes = data['water_intakes'] or []
     
     # Calculate overall statistics
     total_users = len(users)
@@ -1028,6 +1158,32 @@ from callbacks import auth_callbacks
 from callbacks import data_entry_callbacks
 
 
+def _configure_logging(level=logging.INFO):
+    """Route log records through a queue so a background thread does the stream I/O."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    
+    listener.start()
+    atexit.register(listener.stop)
+
+
 # Run the app
 if __name__ == '__main__':
+    _configure_logging()
+    # Open backend connections in the background so the first dashboard load
+    # doesn't pay for the connection setup
+    from services.api_client import clear_auth_token, start_pool_warmup
+
+
+@app.server.teardown_request
+def _clear_request_auth(exc=None):
+    """Drop the API token at the end of each request so a reused worker thread never carries it over."""
+    clear_auth_token()
+    start_pool_warmup()
     app.run(debug=False, host='0.0.0.0', port=8050)
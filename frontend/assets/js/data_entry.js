@@ -0,0 +1,22 @@
+/*
+ * Data Entry clientside functions
+ * Fills the entry forms' date/time defaults from the browser's local clock.
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dataEntry: {
+        // Today's date as YYYY-MM-DD, for type="date" inputs
+        today: function() {
+            const d = new Date();
+            const pad = (n) => String(n).padStart(2, '0');
+            return d.getFullYear() + '-' + pad(d.getMonth() + 1) + '-' + pad(d.getDate());
+        },
+
+        // Current time as HH:MM, for type="time" inputs
+        currentTime: function() {
+            const d = new Date();
+            const pad = (n) => String(n).padStart(2, '0');
+            return pad(d.getHours()) + ':' + pad(d.getMinutes());
+        }
+    }
+});
@@ -3,19 +3,19 @@ Auth Callbacks
 Handles login/logout/register functionality without page reloads.
 """
 
-from dash import callback, Output, Input, State, no_update, ctx, ALL, dcc, html
+from dash import callback, clientside_callback, Output, Input, State, no_update, ctx, ALL, dcc, html
 import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
 import re
+import functools
 
 # Import API client
 import sys
 import os
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from services.api_client import login, logout, get_current_user, register, get_user_health_data
+from services.api_client import login, logout, get_current_user, register, get_user_health_summary
 
 
 @callback(
@@ -330,26 +330,23 @@ def toggle_theme(n_clicks, current_theme):
 # Password Visibility Toggle Callback
 # ============================================================
 
-@callback(
+# Flipping the input type is pure UI state, so it runs in the browser
+clientside_callback(
+    """
+    function(n_clicks, current_type) {
+        if (!n_clicks) {
+            return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+        }
+        // Password now visible shows the hide icon, hidden shows the eye icon
+        return current_type === 'password' ? ['text', '🙈'] : ['password', '👁️'];
+    }
+    """,
     [Output("login-password", "type"),
      Output("toggle-password-visibility", "children")],
     Input("toggle-password-visibility", "n_clicks"),
     State("login-password", "type"),
     prevent_initial_call=True
 )
-def toggle_password_visibility(n_clicks, current_type):
-    """
-    Toggle password field visibility when eye button is clicked.
-    Shows/hides password and updates the button icon accordingly.
-    """
-    if not n_clicks:
-        raise PreventUpdate
-    
-    # Toggle between password and text input types
-    if current_type == "password":
-        return "text", "🙈"  # Password now visible, show hide icon
-    else:
-        return "password", "👁️"  # Password now hidden, show eye icon
 
 
 # ============================================================
@@ -358,7 +355,7 @@ def toggle_password_visibility(n_clicks, current_type):
 
 from dash import html
 import dash_bootstrap_components as dbc
-from services.api_client import get_users, search_users, get_user_health_data
+from services.api_client import get_users, search_users
 
 
 @callback(
@@ -462,52 +459,34 @@ def handle_admin_search(search_clicks, show_all_clicks, search_query):
     return results_table, count_text
 
 
-@callback(
-    Output("selected-user-store", "data"),
-    Input({"type": "view-user-data-btn", "index": ALL}, "n_clicks"),
-    prevent_initial_call=True
-)
-def handle_view_data_click(n_clicks_list):
+# Selecting a user and opening/closing the modal is pure UI state, so it is
+# handled in the browser; only the health data render goes to the server.
+clientside_callback(
     """
-    Handle click on 'View Data' button and update the store with selected user ID.
-    """
-    # Filter out None values and check if any clicks occurred
-    if not n_clicks_list or not any(c for c in n_clicks_list if c):
-        raise PreventUpdate
-    
-    triggered = ctx.triggered_id
-    if not triggered or not isinstance(triggered, dict):
-        raise PreventUpdate
-    
-    user_id = triggered.get("index")
-    if not user_id:
-        raise PreventUpdate
-        
-    return {"user_id": user_id}
-
-
-@callback(
-    Output("user-health-data-modal", "is_open"),
-    [Input("selected-user-store", "data"),
+    function(n_clicks_list, close_clicks) {
+        const no_update = window.dash_clientside.no_update;
+        const triggered = window.dash_clientside.callback_context.triggered;
+        if (!triggered || !triggered.length || !triggered[0].value) {
+            return [no_update, no_update];
+        }
+        const prop_id = triggered[0].prop_id;
+        const component_id = prop_id.slice(0, prop_id.lastIndexOf('.'));
+        if (component_id === 'close-user-data-modal') {
+            return [no_update, false];
+        }
+        const user_id = JSON.parse(component_id).index;
+        if (!user_id) {
+            return [no_update, no_update];
+        }
+        return [{user_id: user_id}, true];
+    }
+    """,
+    [Output("selected-user-store", "data"),
+     Output("user-health-data-modal", "is_open")],
+    [Input({"type": "view-user-data-btn", "index": ALL}, "n_clicks"),
      Input("close-user-data-modal", "n_clicks")],
-    [State("user-health-data-modal", "is_open")],
     prevent_initial_call=True
 )
-def toggle_user_data_modal(store_data, close_clicks, is_open):
-    """
-    Toggle the user data modal.
-    Opens when store data changes (new user selected).
-    Closes when close button is clicked.
-    """
-    triggered = ctx.triggered_id
-    
-    if triggered == "close-user-data-modal":
-        return False
-    
-    if triggered == "selected-user-store" and store_data:
-        return True
-        
-    return is_open
 
 
 @callback(
@@ -526,47 +505,42 @@ def render_user_health_data(store_data):
     if not user_id:
         raise PreventUpdate
     
-    # Get user's health data
-    data = get_user_health_data(user_id)
+    # Get user's health summary (recent records, counts and chart data)
+    data = get_user_health_summary(user_id, limit=5)
     
     if not data:
         return dbc.Alert(f"Could not load data for user ID {user_id}", color="danger")
     
     user_info = data.get('user', {})
-    health_data = data.get('data', {})
+    recent = data.get('recent', {})
     counts = data.get('counts', {})
+    charts = data.get('charts', {})
     
     # --- Generate Charts ---
     
     # 1. Workout Types Pie Chart
-    workouts = health_data.get('workouts', [])
-    if workouts:
-        df_workouts = pd.DataFrame(workouts)
-        if not df_workouts.empty and 'workout_type' in df_workouts.columns:
-            workout_counts = df_workouts['workout_type'].value_counts().reset_index()
-            workout_counts.columns = ['type', 'count']
-            fig_workouts = px.pie(workout_counts, values='count', names='type', title='Workout Types',
-                                 color_discrete_sequence=px.colors.qualitative.Set3)
-            fig_workouts.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
-        else:
-            fig_workouts = go.Figure().add_annotation(text="No workout data", showarrow=False)
+    workout_types = charts.get('workout_types', {})
+    if workout_types:
+        fig_workouts = px.pie(values=list(workout_types.values()), names=list(workout_types.keys()),
+                              title='Workout Types', color_discrete_sequence=px.colors.qualitative.Set3)
+        fig_workouts.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
     else:
         fig_workouts = go.Figure().add_annotation(text="No workout data", showarrow=False)
         
     # 2. Weight Progress Line Chart
-    weight_logs = health_data.get('weight_logs', [])
-    if weight_logs:
-        df_weight = pd.DataFrame(weight_logs)
-        fig_weight = px.line(df_weight, x='log_date', y='weight_kg', markers=True, title='Weight Progress')
+    weight_trend = charts.get('weight_trend', {})
+    if weight_trend.get('dates'):
+        fig_weight = px.line(x=weight_trend['dates'], y=weight_trend['weight_kg'], markers=True,
+                             title='Weight Progress', labels={'x': 'log_date', 'y': 'weight_kg'})
         fig_weight.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
     else:
         fig_weight = go.Figure().add_annotation(text="No weight data", showarrow=False)
 
     # 3. Sleep Trends Bar Chart
-    sleep_logs = health_data.get('sleep_records', [])
-    if sleep_logs:
-        df_sleep = pd.DataFrame(sleep_logs)
-        fig_sleep = px.bar(df_sleep, x='sleep_date', y='total_hours', title='Sleep Duration')
+    sleep_trend = charts.get('sleep_trend', {})
+    if sleep_trend.get('dates'):
+        fig_sleep = px.bar(x=sleep_trend['dates'], y=sleep_trend['total_hours'],
+                           title='Sleep Duration', labels={'x': 'sleep_date', 'y': 'total_hours'})
         fig_sleep.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
     else:
         fig_sleep = go.Figure().add_annotation(text="No sleep data", showarrow=False)
@@ -622,23 +596,23 @@ def render_user_health_data(store_data):
             # Show a few recent entries from each category
             dbc.Accordion([
                 dbc.AccordionItem([
-                    _render_data_table(health_data.get('workouts', [])[:5], 
+                    _render_data_table(recent.get('workouts', []), 
                                        ['workout_date', 'workout_type', 'duration_minutes', 'calories_burned'])
                 ], title=f"💪 Workouts ({counts.get('workouts', 0)} total)"),
                 dbc.AccordionItem([
-                    _render_data_table(health_data.get('meals', [])[:5],
+                    _render_data_table(recent.get('meals', []),
                                        ['meal_date', 'meal_type', 'food_name', 'calories'])
                 ], title=f"🍽️ Meals ({counts.get('meals', 0)} total)"),
                 dbc.AccordionItem([
-                    _render_data_table(health_data.get('sleep_records', [])[:5],
+                    _render_data_table(recent.get('sleep_records', []),
                                        ['sleep_date', 'total_hours', 'sleep_quality'])
                 ], title=f"😴 Sleep ({counts.get('sleep_records', 0)} total)"),
                 dbc.AccordionItem([
-                    _render_data_table(health_data.get('water_intakes', [])[:5],
+                    _render_data_table(recent.get('water_intakes', []),
                                        ['intake_date', 'amount_ml'])
                 ], title=f"💧 Water ({counts.get('water_intakes', 0)} total)"),
                 dbc.AccordionItem([
-                    _render_data_table(health_data.get('weight_logs', [])[:5],
+                    _render_data_table(recent.get('weight_logs', []),
                                        ['log_date', 'weight_kg'])
                 ], title=f"⚖️ Weight ({counts.get('weight_logs', 0)} total)"),
             ], start_collapsed=True)
@@ -651,19 +625,25 @@ def _render_data_table(data_list, columns):
     if not data_list:
         return html.P("No data recorded yet.", className="text-muted")
     
+    # Only the displayed columns matter, so key the cache on those values
+    rows = tuple(tuple(item.get(col, '-') for col in columns) for item in data_list)
+    return _build_data_table(tuple(columns), rows)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_data_table(columns, rows):
+    """Build the table for hashable (columns, rows); repeat views reuse the result."""
     # Build table header
     header = html.Thead(html.Tr([html.Th(col.replace('_', ' ').title()) for col in columns]))
     
     # Build table rows
-    rows = []
-    for item in data_list:
+    table_rows = []
+    for row in rows:
         row_cells = []
-        for col in columns:
-            value = item.get(col, '-')
+        for value in row:
             if value is None:
                 value = '-'
             row_cells.append(html.Td(str(value)))
-        rows.append(html.Tr(row_cells))
+        table_rows.append(html.Tr(row_cells))
     
-    return dbc.Table([header, html.Tbody(rows)], striped=True, bordered=True, size="sm")
-
+    return dbc.Table([header, html.Tbody(table_rows)], striped=True, bordered=True, size="sm")
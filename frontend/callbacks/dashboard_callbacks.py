@@ -3,23 +3,47 @@ Dashboard Callbacks
 Real-time update callbacks for dashboard auto-refresh and notifications.
 """
 
-from dash import callback, Output, Input, State, ctx, dcc
+from dash import callback, clientside_callback, Output, Input, State, ctx, dcc, no_update
 from dash.exceptions import PreventUpdate
+import pandas as pd
 import sys
 import os
+import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from services.api_client import get_workouts, get_meals, get_weight_logs, get_sleep_records, get_water_intakes
 from layouts.dashboard_layout import (
+    get_dashboard_data,
     create_weight_line_chart,
     create_workout_bar_chart,
     create_macro_pie_chart,
     create_calorie_area_chart,
     create_water_gauge_chart,
     create_sleep_trend_chart,
-    calculate_summary_stats
+    calculate_summary_stats,
+    get_data_counts
 )
 
+# Which dataset each figure output depends on, in output order
+_FIGURE_DATASETS = ('weight', 'workouts', 'meals', 'meals', 'water', 'sleep')
+
+
+def _toast_value(row, column, default=None, integer=False):
+    """
+    Read a value for the toast text from a frame row.
+    
+    Missing values come back as the default instead of NaN, and integer
+    columns that pandas upcast to float (because of NaNs) are shown as ints.
+    """
+    value = row.get(column, default)
+    if not pd.notna(value):
+        return default
+    return int(value) if integer else value
+
+
+def _has_new_records(current_count, last_count, key):
+    """True if a dataset's max id grew since the last tick."""
+    return current_count[key][1] > (last_count.get(key) or [0, 0])[1]
+
 
 @callback(
     [Output("weight-trend-chart", "figure"),
@@ -31,15 +55,18 @@ from layouts.dashboard_layout import (
      Output("last-updated", "children"),
      Output("data-update-toast", "is_open"),
      Output("data-update-toast", "children"),
-     Output("last-data-count", "data")],
+     Output("last-data-count", "data"),
+     Output("dashboard-stats-store", "data")],
     [Input("interval-component", "n_intervals")],
     [State("auth-store", "data"),
-     State("last-data-count", "data")],
+     State("last-data-count", "data"),
+     State("dashboard-stats-store", "data")],
     prevent_initial_call=True
 )
-def update_dashboard_realtime(n_intervals, auth_data, last_count):
+def update_dashboard_realtime(n_intervals, auth_data, last_count, last_stats):
     """
     Auto-refresh dashboard every 2 seconds.
+    Only figures whose dataset changed are sent back; the rest are no_update.
     Shows notification if new data detected.
     """
     if not auth_data:
@@ -47,33 +74,31 @@ def update_dashboard_realtime(n_intervals, auth_data, last_count):
     
     user_id = auth_data.get('user_id', 1)
     
-    # Fetch latest data
-    workouts = get_workouts(user_id=user_id) or []
-    meals = get_meals(user_id=user_id) or []
-    weight_logs = get_weight_logs(user_id=user_id) or []
-    sleep_records = get_sleep_records(user_id=user_id) or []
-    water_intakes = get_water_intakes(user_id=user_id) or []
+    # Fetch latest data as parsed frames
+    workouts, meals, weight_logs, sleep_records, water_intakes = get_dashboard_data(user_id=user_id)
+    if workouts is None:
+        raise PreventUpdate
     
-    # Create updated charts
-    weight_chart = create_weight_line_chart(weight_logs)
-    workout_chart = create_workout_bar_chart(workouts)
-    macro_chart = create_macro_pie_chart(meals)
-    calorie_chart = create_calorie_area_chart(meals)
-    water_gauge = create_water_gauge_chart(water_intakes)
-    sleep_trend = create_sleep_trend_chart(sleep_records)
+    current_count = get_data_counts(workouts, meals, weight_logs, sleep_records, water_intakes)
     
-    # Update timestamp
-    from datetime import datetime
-    timestamp = f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    # A new day changes the "today"/"this week" windows of every chart
+    if not last_count or last_count.get('date') != current_count['date']:
+        changed = set(_FIGURE_DATASETS)
+    else:
+        changed = {key for key in _FIGURE_DATASETS if current_count[key] != last_count.get(key)}
     
-    # Check for new data
-    current_count = {
-        'workouts': len(workouts),
-        'meals': len(meals),
-        'weight': len(weight_logs),
-        'sleep': len(sleep_records),
-        'water': len(water_intakes)
-    }
+    # Rebuild only the charts whose data changed
+    weight_chart = create_weight_line_chart(weight_logs) if 'weight' in changed else no_update
+    workout_chart = create_workout_bar_chart(workouts) if 'workouts' in changed else no_update
+    macro_chart = create_macro_pie_chart(meals) if 'meals' in changed else no_update
+    calorie_chart = create_calorie_area_chart(meals) if 'meals' in changed else no_update
+    water_gauge = create_water_gauge_chart(water_intakes) if 'water' in changed else no_update
+    sleep_trend = create_sleep_trend_chart(sleep_records) if 'sleep' in changed else no_update
+    
+    stats = calculate_summary_stats(workouts, meals, sleep_records, water_intakes)
+    
+    # Update timestamp
+    timestamp = f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}"
     
     # Detect changes
     toast_open = False
@@ -83,39 +108,39 @@ def update_dashboard_realtime(n_intervals, auth_data, last_count):
         new_items = []
         
         # Check Workouts
-        if current_count['workouts'] > last_count.get('workouts', 0):
-            # Find newest workout (max ID)
-            if workouts:
-                newest = max(workouts, key=lambda x: x.get('id', 0))
+        if _has_new_records(current_count, last_count, 'workouts'):
+            if not workouts.empty:
+                # Find newest workout (max ID)
+                newest = workouts.loc[workouts['id'].idxmax()]
                 # Preview: "Run (30 mins)"
-                desc = f"{newest.get('workout_name', 'Workout')} ({newest.get('duration_minutes')} min)"
+                desc = f"{_toast_value(newest, 'workout_name', 'Workout')} ({_toast_value(newest, 'duration_minutes', integer=True)} min)"
                 new_items.append(f"💪 Added: {desc}")
                 
         # Check Meals
-        if current_count['meals'] > last_count.get('meals', 0):
-            if meals:
-                newest = max(meals, key=lambda x: x.get('id', 0))
+        if _has_new_records(current_count, last_count, 'meals'):
+            if not meals.empty:
+                newest = meals.loc[meals['id'].idxmax()]
                 # Preview: "Burger (500 kcal)"
-                desc = f"{newest.get('meal_name', 'Meal')} ({newest.get('calories')} kcal)"
+                desc = f"{_toast_value(newest, 'meal_name', 'Meal')} ({_toast_value(newest, 'calories')} kcal)"
                 new_items.append(f"🍽️ Added: {desc}")
                 
         # Check Weight
-        if current_count['weight'] > last_count.get('weight', 0):
-            if weight_logs:
-                newest = max(weight_logs, key=lambda x: x.get('id', 0))
-                new_items.append(f"⚖️ Weight logged: {newest.get('weight_kg')} kg")
+        if _has_new_records(current_count, last_count, 'weight'):
+            if not weight_logs.empty:
+                newest = weight_logs.loc[weight_logs['id'].idxmax()]
+                new_items.append(f"⚖️ Weight logged: {_toast_value(newest, 'weight_kg')} kg")
                 
         # Check Sleep
-        if current_count['sleep'] > last_count.get('sleep', 0):
-            if sleep_records:
-                newest = max(sleep_records, key=lambda x: x.get('id', 0))
-                new_items.append(f"😴 Sleep logged: {newest.get('total_hours')} hrs")
+        if _has_new_records(current_count, last_count, 'sleep'):
+            if not sleep_records.empty:
+                newest = sleep_records.loc[sleep_records['id'].idxmax()]
+                new_items.append(f"😴 Sleep logged: {_toast_value(newest, 'total_hours')} hrs")
                 
         # Check Water
-        if current_count['water'] > last_count.get('water', 0):
-            if water_intakes:
-                newest = max(water_intakes, key=lambda x: x.get('id', 0))
-                new_items.append(f"💧 Water logged: {newest.get('amount_ml')} ml")
+        if _has_new_records(current_count, last_count, 'water'):
+            if not water_intakes.empty:
+                newest = water_intakes.loc[water_intakes['id'].idxmax()]
+                new_items.append(f"💧 Water logged: {_toast_value(newest, 'amount_ml', integer=True)} ml")
         
         if new_items:
             toast_open = True
@@ -135,5 +160,86 @@ def update_dashboard_realtime(n_intervals, auth_data, last_count):
         timestamp,
         toast_open,
         toast_message,
-        current_count
+        current_count,
+        stats if stats != last_stats else no_update
+    )
+
+
+# Render the stat card values in the browser from the small stats store
+clientside_callback(
+    """
+    function(stats) {
+        if (!stats) {
+            return window.dash_clientside.no_update;
+        }
+        const fmt = (value) => Number(value || 0).toLocaleString('en-US');
+        return [
+            fmt(stats.calories_today) + ' kcal',
+            String(stats.workouts_week || 0) + ' sessions',
+            String(stats.avg_sleep || 0) + ' hours',
+            fmt(stats.water_today) + ' ml'
+        ];
+    }
+    """,
+    [Output("stat-calories-today", "children"),
+     Output("stat-workouts-week", "children"),
+     Output("stat-avg-sleep", "children"),
+     Output("stat-water-today", "children")],
+    Input("dashboard-stats-store", "data"),
+    prevent_initial_call=True
+)
+
+
+# ============================================================
+# Lazy Chart Loading
+# ============================================================
+
+# Flag the lower chart rows as visible once they come within 200px of the
+# viewport, then stop polling
+clientside_callback(
+    """
+    function(n_intervals) {
+        const no_update = window.dash_clientside.no_update;
+        const el = document.getElementById('lazy-charts');
+        if (!el) {
+            return [no_update, no_update];
+        }
+        if (el.getBoundingClientRect().top < window.innerHeight + 200) {
+            return [true, true];
+        }
+        return [no_update, no_update];
+    }
+    """,
+    [Output("lazy-charts-visible", "data"),
+     Output("lazy-charts-poll", "disabled")],
+    Input("lazy-charts-poll", "n_intervals")
+)
+
+
+@callback(
+    [Output("macro-pie-chart", "figure", allow_duplicate=True),
+     Output("calorie-area-chart", "figure", allow_duplicate=True),
+     Output("water-gauge-chart", "figure", allow_duplicate=True),
+     Output("sleep-trend-chart", "figure", allow_duplicate=True)],
+    Input("lazy-charts-visible", "data"),
+    State("auth-store", "data"),
+    prevent_initial_call=True
+)
+def load_lazy_charts(visible, auth_data):
+    """Build the below-the-fold charts once they scroll into view."""
+    if not visible or not auth_data:
+        raise PreventUpdate
+    
+    user_id = auth_data.get('user_id', 1)
+    workouts, meals, weight_logs, sleep_records, water_intakes = get_dashboard_data(user_id=user_id)
+    if workouts is None:
+        # Backend is down: show the empty states rather than leave the
+        # "Loading..." placeholders up until the data next changes
+        meals = water_intakes = sleep_records = pd.DataFrame()
+    
+    return (
+        create_macro_pie_chart(meals),
+        create_calorie_area_chart(meals),
+        create_water_gauge_chart(water_intakes),
+        create_sleep_trend_chart(sleep_records)
     )
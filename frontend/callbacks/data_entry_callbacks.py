@@ -4,9 +4,12 @@ Handles form submissions for health data entry.
 All data is automatically linked to the logged-in user.
 """
 
-from dash import callback, Output, Input, State, no_update, html
+from dash import callback, clientside_callback, ClientsideFunction, Output, Input, State, no_update, html, ctx, ALL
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+import logging
+import queue
+import threading
 
 # Import API client
 import sys
@@ -20,6 +23,37 @@ from services.api_client import (
     create_workout,
     log_activity
 )
+from layouts.data_entry_layout import (
+    create_weight_form,
+    create_sleep_form,
+    create_water_form,
+    create_meal_form,
+    create_workout_form
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Activity log writes are queued and sent by a background worker so the
+# save callbacks return as soon as the record itself has been created.
+activity_queue = queue.Queue()
+
+
+def _activity_worker():
+    """Drain the activity queue, posting each entry to the backend."""
+    while True:
+        entry = activity_queue.get()
+        try:
+            log_activity(**entry)
+        except Exception:
+            # Keep the worker alive; request errors are already logged by the client
+            logger.exception("Activity log error")
+        finally:
+            activity_queue.task_done()
+
+
+threading.Thread(target=_activity_worker, name="activity-log-worker", daemon=True).start()
 
 
 def create_success_message(text: str):
@@ -68,14 +102,14 @@ def save_weight(n_clicks, date, weight_kg, body_fat, notes, auth_data):
     
     if result:
         # Log the activity
-        log_activity(
+        activity_queue.put(dict(
             user_id=user_id,
             username=username,
             action_type="CREATE",
             entity_type="weight",
             description=f"Logged weight: {weight_kg} kg on {date}",
             entity_id=result.get('id')
-        )
+        ))
         return create_success_message(f"✅ Weight logged: {weight_kg} kg")
     else:
         return create_error_message("Failed to save weight. Please try again.")
@@ -124,14 +158,14 @@ def save_sleep(n_clicks, date, bed_time, wake_time, hours, quality, notes, auth_
     )
     
     if result:
-        log_activity(
+        activity_queue.put(dict(
             user_id=user_id,
             username=username,
             action_type="CREATE",
             entity_type="sleep",
             description=f"Logged sleep: {hours} hours on {date}",
             entity_id=result.get('id')
-        )
+        ))
         return create_success_message(f"✅ Sleep logged: {hours} hours")
     else:
         return create_error_message("Failed to save sleep record. Please try again.")
@@ -172,14 +206,14 @@ def save_water(n_clicks, date, time, amount, beverage, auth_data):
     )
     
     if result:
-        log_activity(
+        activity_queue.put(dict(
             user_id=user_id,
             username=username,
             action_type="CREATE",
             entity_type="water",
             description=f"Logged water: {amount} ml of {beverage} on {date}",
             entity_id=result.get('id')
-        )
+        ))
         return create_success_message(f"✅ Water logged: {amount} ml of {beverage}")
     else:
         return create_error_message("Failed to save water intake. Please try again.")
@@ -188,27 +222,15 @@ def save_water(n_clicks, date, time, amount, beverage, auth_data):
 # Quick add water buttons
 @callback(
     Output("water-amount", "value"),
-    [Input("water-quick-250", "n_clicks"),
-     Input("water-quick-500", "n_clicks"),
-     Input("water-quick-1000", "n_clicks")],
+    Input({"type": "water-quick", "amount": ALL}, "n_clicks"),
     prevent_initial_call=True
 )
-def quick_add_water(btn_250, btn_500, btn_1000):
+def quick_add_water(n_clicks_list):
     """Quick add water amounts."""
-    from dash import ctx
-    if not ctx.triggered:
+    if not ctx.triggered_id or not any(n_clicks_list):
         raise PreventUpdate
     
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    
-    if button_id == "water-quick-250":
-        return 250
-    elif button_id == "water-quick-500":
-        return 500
-    elif button_id == "water-quick-1000":
-        return 1000
-    
-    raise PreventUpdate
+    return ctx.triggered_id["amount"]
 
 
 # ==================== MEAL ENTRY ====================
@@ -254,14 +276,14 @@ def save_meal(n_clicks, date, meal_type, name, calories, protein, carbs, fat, no
     )
     
     if result:
-        log_activity(
+        activity_queue.put(dict(
             user_id=user_id,
             username=username,
             action_type="CREATE",
             entity_type="meal",
             description=f"Logged meal: {name} ({calories or 0} kcal) - {meal_type}",
             entity_id=result.get('id')
-        )
+        ))
         return create_success_message(f"✅ Meal logged: {name} ({calories or 0} kcal)")
     else:
         return create_error_message("Failed to save meal. Please try again.")
@@ -310,14 +332,65 @@ def save_workout(n_clicks, date, workout_type, name, duration, calories, distanc
     )
     
     if result:
-        log_activity(
+        activity_queue.put(dict(
             user_id=user_id,
             username=username,
             action_type="CREATE",
             entity_type="workout",
             description=f"Logged workout: {name} ({duration} min) - {workout_type}",
             entity_id=result.get('id')
-        )
+        ))
         return create_success_message(f"✅ Workout logged: {name} ({duration} min)")
     else:
         return create_error_message("Failed to save workout. Please try again.")
+
+
+# ==================== LAZY TAB FORMS ====================
+
+# Form builder for each tab, in tab order
+_TAB_FORMS = {
+    "weight-tab": create_weight_form,
+    "sleep-tab": create_sleep_form,
+    "water-tab": create_water_form,
+    "meals-tab": create_meal_form,
+    "workout-tab": create_workout_form,
+}
+
+
+@callback(
+    [Output(f"{tab_id}-content", "children") for tab_id in _TAB_FORMS]
+    + [Output("data-entry-loaded-tabs", "data")],
+    Input("data-entry-tabs", "active_tab"),
+    State("data-entry-loaded-tabs", "data"),
+    prevent_initial_call=True
+)
+def load_tab_form(active_tab, loaded_tabs):
+    """Render a tab's form the first time the tab is opened."""
+    loaded_tabs = loaded_tabs or []
+    if active_tab not in _TAB_FORMS or active_tab in loaded_tabs:
+        raise PreventUpdate
+    
+    children = [
+        build_form() if tab_id == active_tab else no_update
+        for tab_id, build_form in _TAB_FORMS.items()
+    ]
+    return children + [loaded_tabs + [active_tab]]
+
+
+# ==================== DATE / TIME DEFAULTS ====================
+# The entry forms are built once and cached server-side, so today's date and
+# the current time are filled in by the browser when each field mounts
+# (see assets/js/data_entry.js).
+
+for _date_field in ("weight-date", "sleep-date", "water-date", "meal-date", "workout-date"):
+    clientside_callback(
+        ClientsideFunction(namespace="dataEntry", function_name="today"),
+        Output(_date_field, "value"),
+        Input(_date_field, "id")
+    )
+
+clientside_callback(
+    ClientsideFunction(namespace="dataEntry", function_name="currentTime"),
+    Output("water-time", "value"),
+    Input("water-time", "id")
+)
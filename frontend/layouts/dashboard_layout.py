@@ -6,10 +6,18 @@ Includes auto-refresh interval component for real-time updates.
 
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache, partial, wraps
+from bisect import bisect_right
+from types import MappingProxyType
+import hashlib
+import json
+import threading
+import time
+import flask
 
 # Import API client
 import sys
@@ -22,24 +30,123 @@ from services.api_client import (
     get_weight_logs,
     get_sleep_records,
     get_water_intakes,
-    check_backend_health
+    check_backend_health,
+    fetch_concurrently
 )
 
 
+# ============================================================
+# Request Clock
+# ============================================================
+
+def _now() -> datetime:
+    """
+    Return the current time, fixed for the duration of a request.
+    
+    Every chart and stat in one render then agrees on what "today" is,
+    even across midnight. Outside a request it is just datetime.now().
+    """
+    if not flask.has_request_context():
+        return datetime.now()
+    now = getattr(flask.g, '_dash_now', None)
+    if now is None:
+        now = flask.g._dash_now = datetime.now()
+    return now
+
+
+# ============================================================
+# Figure Cache
+# ============================================================
+
+# Built figures are kept as plotly JSON for a short time, keyed by chart,
+# date and a fingerprint of the input records. Unchanged data between
+# dashboard refreshes skips the DataFrame work and figure construction.
+FIGURE_CACHE_TTL = 30  # seconds
+FIGURE_CACHE_MAXSIZE = 256
+_figure_cache = {}
+_figure_cache_lock = threading.Lock()
+
+
+def _data_fingerprint(data) -> str:
+    """Return a short content hash of the chart input frame."""
+    digest = hashlib.blake2b(digest_size=8)
+    if isinstance(data, pd.DataFrame):
+        digest.update(json.dumps(list(map(str, data.columns))).encode())
+        if not data.empty:
+            digest.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    else:
+        digest.update(json.dumps(data, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def memoize_figure(chart_fn):
+    """
+    Cache a chart factory's output keyed on the content of its data.
+    
+    The wrapped factory returns the figure as a plotly JSON dict, which
+    dcc.Graph accepts directly, so cache hits skip go.Figure reconstruction.
+    """
+    @wraps(chart_fn)
+    def wrapper(data):
+        key = (chart_fn.__name__, _now().date(), _data_fingerprint(data))
+        now = time.monotonic()
+        
+        with _figure_cache_lock:
+            cached = _figure_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        
+        # Build outside the lock; concurrent misses just build it twice
+        fig = chart_fn(data)
+        if not isinstance(fig, dict):
+            fig = fig.to_plotly_json()
+        
+        with _figure_cache_lock:
+            if len(_figure_cache) >= FIGURE_CACHE_MAXSIZE:
+                # Drop expired entries, then the oldest if still full
+                for stale_key in [k for k, (expires, _) in _figure_cache.items() if expires <= now]:
+                    del _figure_cache[stale_key]
+                if len(_figure_cache) >= FIGURE_CACHE_MAXSIZE:
+                    _figure_cache.pop(next(iter(_figure_cache)))
+            _figure_cache[key] = (now + FIGURE_CACHE_TTL, fig)
+        return fig
+    
+    return wrapper
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
 
-def create_stat_card(title: str, value: str, unit: str, icon: str, color: str = "primary"):
-    """Create a summary statistics card."""
-    color_map = {
-        "primary": "#4F46E5",
-        "success": "#10B981",
-        "warning": "#F59E0B",
-        "danger": "#EF4444",
-        "info": "#3B82F6"
-    }
-    
+def _days(dates: pd.Series) -> np.ndarray:
+    """View a parsed date column as datetime64[D] for vectorized day compares."""
+    return dates.to_numpy().astype('datetime64[D]')
+
+
+_COLOR_MAP = MappingProxyType({
+    "primary": "#4F46E5",
+    "success": "#10B981",
+    "warning": "#F59E0B",
+    "danger": "#EF4444",
+    "info": "#3B82F6"
+})
+
+_CARD_CLASS = "stat-card h-100"
+_CARD_STYLE = {
+    "borderRadius": "12px",
+    "border": "none",
+    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
+}
+
+
+@lru_cache(maxsize=64)
+def create_stat_card(title: str, value: str, unit: str, icon: str, color: str = "primary",
+                     value_id: str = None):
+    """
+    Create a summary statistics card. value_id lets callbacks update the value.
+    
+    Cached on its arguments, so re-rendering unchanged stats reuses the component.
+    """
     return dbc.Card([
         dbc.CardBody([
             html.Div([
@@ -49,147 +156,168 @@ def create_stat_card(title: str, value: str, unit: str, icon: str, color: str =
             html.H3(
                 f"{value} {unit}", 
                 className="mb-0 fw-bold",
-                style={"color": color_map.get(color, "#4F46E5")}
+                style={"color": _COLOR_MAP.get(color, "#4F46E5")},
+                **({"id": value_id} if value_id else {})
             )
         ], className="text-center")
-    ], className="stat-card h-100", style={
-        "borderRadius": "12px",
-        "border": "none",
-        "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-    })
+    ], className=_CARD_CLASS, style=_CARD_STYLE)
 
 
-def create_empty_chart(title: str, message: str = "No data available"):
-    """Create an empty chart placeholder."""
+# Plotly layout pieces shared by every chart; update_layout copies them.
+# Set titles with title_text/xaxis_title_text so these title fonts survive.
+_GRID = dict(showgrid=True, gridcolor='#E5E7EB', title_font=dict(size=12))
+_BASE_LAYOUT = dict(
+    paper_bgcolor="white",
+    plot_bgcolor="white",
+    height=350,
+    margin=dict(l=40, r=40, t=60, b=40),
+    xaxis=_GRID,
+    yaxis=_GRID,
+    title_font=dict(size=16)
+)
+_EMPTY_LAYOUT = dict(
+    xaxis=dict(visible=False),
+    yaxis=dict(visible=False),
+    paper_bgcolor="white",
+    plot_bgcolor="white",
+    height=350
+)
+_EMPTY_ANNOTATION = dict(
+    xref="paper", yref="paper",
+    x=0.5, y=0.5,
+    showarrow=False,
+    font=dict(size=16, color="#6B7280")
+)
+
+@lru_cache(maxsize=32)
+def create_empty_chart(title: str, message: str = "No data available") -> dict:
+    """Create an empty chart placeholder, as plotly JSON shared across calls."""
     fig = go.Figure()
-    fig.add_annotation(
-        text=message,
-        xref="paper", yref="paper",
-        x=0.5, y=0.5,
-        showarrow=False,
-        font=dict(size=16, color="#6B7280")
-    )
-    fig.update_layout(
-        title=title,
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=350
-    )
-    return fig
+    fig.add_annotation(text=message, **_EMPTY_ANNOTATION)
+    fig.update_layout(**_EMPTY_LAYOUT, title=title)
+    return fig.to_plotly_json()
+
+
+# Line charts with more points than this are downsampled before plotting
+MAX_LINE_POINTS = 500
 
 
-def create_weight_line_chart(weight_data: list) -> go.Figure:
-    """Create a line chart showing weight progress over time."""
-    if not weight_data:
+def _lttb(x: np.ndarray, y: np.ndarray, threshold: int):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previously kept point and
+    the next bucket's average, which preserves the visual shape of the line.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+    
+    # Triangle areas need a numeric x axis
+    if np.issubdtype(x.dtype, np.datetime64):
+        xs = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    else:
+        xs = x.astype(np.float64)
+    
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        next_start, next_end = end, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = xs[next_start:max(next_end, next_start + 1)].mean()
+        avg_y = y[next_start:max(next_end, next_start + 1)].mean()
+        
+        areas = np.abs(
+            (xs[a] - avg_x) * (y[start:end] - y[a])
+            - (xs[a] - xs[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    
+    return x[keep], y[keep]
+
+
+@memoize_figure
+def create_weight_line_chart(df: pd.DataFrame) -> dict:
+    """Create a line chart showing weight progress over time (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Weight Progress", "No weight data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(weight_data)
-    df['log_date'] = pd.to_datetime(df['log_date'])
     df = df.sort_values('log_date')
+    x = df['log_date'].to_numpy()
+    y = df['weight_kg'].to_numpy(dtype=np.float64)
     
-    # Create line chart
-    fig = px.line(
-        df,
-        x='log_date',
-        y='weight_kg',
-        title='📈 Weight Progress Over Time',
-        markers=True,
-        labels={'log_date': 'Date', 'weight_kg': 'Weight (kg)'}
-    )
+    # Long histories ship far more points than the chart can show
+    if len(df) > MAX_LINE_POINTS:
+        x, y = _lttb(x, y, MAX_LINE_POINTS)
     
-    # Customize appearance
-    fig.update_traces(
+    # Create line chart
+    fig = go.Figure(go.Scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
         line=dict(color='#4F46E5', width=3),
-        marker=dict(size=8, color='#4F46E5')
-    )
+        marker=dict(size=8, color='#4F46E5'),
+        hovertemplate='Weight (kg)=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='#E5E7EB',
-            title_font=dict(size=12)
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#E5E7EB',
-            title_font=dict(size=12)
-        ),
-        title_font=dict(size=16),
+        **_BASE_LAYOUT,
+        title_text='📈 Weight Progress Over Time',
         hovermode='x unified'
     )
+    fig.update_layout(xaxis_title_text='Date', yaxis_title_text='Weight (kg)')
     
     return fig
 
 
-def create_workout_bar_chart(workout_data: list) -> go.Figure:
-    """Create a bar chart showing workout duration by type."""
-    if not workout_data:
+@memoize_figure
+def create_workout_bar_chart(df: pd.DataFrame) -> dict:
+    """Create a bar chart showing workout duration by type (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Weekly Workouts", "No workout data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(workout_data)
-    df['workout_date'] = pd.to_datetime(df['workout_date'])
-    
     # Filter last 7 days
-    last_week = datetime.now().date() - timedelta(days=7)
-    df = df[df['workout_date'].dt.date >= last_week]
+    last_week = np.datetime64(_now().date() - timedelta(days=7), 'D')
+    df = df[_days(df['workout_date']) >= last_week]
     
     if df.empty:
         return create_empty_chart("Weekly Workouts", "No workouts in the last 7 days")
     
-    # Group by workout type
-    workout_summary = df.groupby('workout_type').agg({
-        'duration_minutes': 'sum',
-        'calories_burned': 'sum'
-    }).reset_index()
+    # Sum minutes per workout type (a handful of categories, so skip groupby)
+    df = df[df['workout_type'].notna()]
+    types, inverse = np.unique(df['workout_type'].to_numpy(dtype=str), return_inverse=True)
+    minutes = np.bincount(inverse, weights=df['duration_minutes'].fillna(0).to_numpy(dtype=float))
     
     # Create bar chart
-    fig = px.bar(
-        workout_summary,
-        x='workout_type',
-        y='duration_minutes',
-        color='workout_type',
-        title='💪 Weekly Workout Summary',
-        labels={'workout_type': 'Workout Type', 'duration_minutes': 'Total Minutes'},
-        color_discrete_sequence=['#4F46E5', '#10B981', '#F59E0B', '#EF4444']
-    )
+    palette = ['#4F46E5', '#10B981', '#F59E0B', '#EF4444']
+    fig = go.Figure(go.Bar(
+        x=types,
+        y=minutes,
+        marker_color=[palette[i % len(palette)] for i in range(len(types))],
+        hovertemplate='Workout Type=%{x}<br>Total Minutes=%{y}<extra></extra>'
+    ))
     
     fig.update_layout(
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40),
-        showlegend=False,
-        xaxis=dict(
-            showgrid=False,
-            title_font=dict(size=12)
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#E5E7EB',
-            title_font=dict(size=12)
-        ),
-        title_font=dict(size=16)
+        **_BASE_LAYOUT,
+        title_text='💪 Weekly Workout Summary',
+        showlegend=False
     )
+    fig.update_layout(xaxis_showgrid=False, xaxis_title_text='Workout Type', yaxis_title_text='Total Minutes')
     
     return fig
 
 
-def create_macro_pie_chart(meal_data: list) -> go.Figure:
-    """Create a pie/donut chart showing macronutrient distribution."""
-    if not meal_data:
+@memoize_figure
+def create_macro_pie_chart(df: pd.DataFrame) -> dict:
+    """Create a pie/donut chart showing macronutrient distribution (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Macronutrients", "No nutrition data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(meal_data)
-    
     # Calculate total macros
     total_protein = df['protein_g'].sum()
     total_carbs = df['carbs_g'].sum()
@@ -198,29 +326,19 @@ def create_macro_pie_chart(meal_data: list) -> go.Figure:
     if total_protein + total_carbs + total_fat == 0:
         return create_empty_chart("Macronutrients", "No macronutrient data available")
     
-    # Create pie chart data
-    macro_data = pd.DataFrame({
-        'nutrient': ['Protein', 'Carbs', 'Fat'],
-        'grams': [total_protein, total_carbs, total_fat]
-    })
-    
     # Create donut chart
-    fig = px.pie(
-        macro_data,
-        values='grams',
-        names='nutrient',
-        title='🥗 Macronutrient Distribution',
+    fig = go.Figure(go.Pie(
+        labels=['Protein', 'Carbs', 'Fat'],
+        values=[total_protein, total_carbs, total_fat],
         hole=0.4,
-        color_discrete_sequence=['#10B981', '#3B82F6', '#F59E0B']
-    )
-    
-    fig.update_traces(
+        marker=dict(colors=['#10B981', '#3B82F6', '#F59E0B']),
         textposition='inside',
         textinfo='percent+label',
         hovertemplate='%{label}: %{value:.1f}g<extra></extra>'
-    )
+    ))
     
     fig.update_layout(
+        title='🥗 Macronutrient Distribution',
         paper_bgcolor="white",
         height=350,
         margin=dict(l=20, r=20, t=60, b=20),
@@ -237,49 +355,44 @@ def create_macro_pie_chart(meal_data: list) -> go.Figure:
     return fig
 
 
-def create_calorie_area_chart(meal_data: list) -> go.Figure:
-    """Create an area chart showing daily calorie intake."""
-    if not meal_data:
+@memoize_figure
+def create_calorie_area_chart(df: pd.DataFrame) -> dict:
+    """Create an area chart showing daily calorie intake (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Daily Calories", "No calorie data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(meal_data)
-    df['meal_date'] = pd.to_datetime(df['meal_date'])
-    
-    # Group by date and meal type
-    daily_calories = df.groupby(['meal_date', 'meal_type'])['calories'].sum().reset_index()
+    # Sum calories per (date, meal type) with a composite integer key,
+    # keeping only the combinations that actually occur
+    df = df[df['meal_date'].notna() & df['meal_type'].notna()]
+    dates, date_idx = np.unique(df['meal_date'].to_numpy(), return_inverse=True)
+    meal_types, type_idx = np.unique(df['meal_type'].to_numpy(dtype=str), return_inverse=True)
+    keys, key_idx = np.unique(date_idx * len(meal_types) + type_idx, return_inverse=True)
+    totals = np.bincount(key_idx, weights=df['calories'].fillna(0).to_numpy(dtype=float))
     
-    if daily_calories.empty:
+    if len(keys) == 0:
         return create_empty_chart("Daily Calories", "No calorie data available")
     
-    # Create area chart
-    fig = px.area(
-        daily_calories,
-        x='meal_date',
-        y='calories',
-        color='meal_type',
-        title='🔥 Daily Calorie Intake by Meal',
-        labels={'meal_date': 'Date', 'calories': 'Calories', 'meal_type': 'Meal Type'},
-        color_discrete_sequence=['#4F46E5', '#10B981', '#F59E0B', '#EF4444']
-    )
+    # One stacked area trace per meal type
+    n_types = len(meal_types)
+    palette = ['#4F46E5', '#10B981', '#F59E0B', '#EF4444']
+    fig = go.Figure([
+        go.Scatter(
+            x=dates[keys[keys % n_types == i] // n_types],
+            y=totals[keys % n_types == i],
+            name=meal_type,
+            mode='lines',
+            stackgroup='one',
+            line=dict(color=palette[i % len(palette)]),
+            hovertemplate='Date=%{x}<br>Calories=%{y}<extra>%{fullData.name}</extra>'
+        )
+        for i, meal_type in enumerate(meal_types)
+    ])
     
     fig.update_layout(
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='#E5E7EB',
-            title_font=dict(size=12)
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#E5E7EB',
-            title_font=dict(size=12)
-        ),
-        title_font=dict(size=16),
+        **_BASE_LAYOUT,
+        title_text='🔥 Daily Calorie Intake by Meal',
         legend=dict(
+            title=dict(text='Meal Type'),
             orientation="h",
             yanchor="bottom",
             y=-0.2,
@@ -287,22 +400,30 @@ def create_calorie_area_chart(meal_data: list) -> go.Figure:
             x=0.5
         )
     )
+    fig.update_layout(xaxis_title_text='Date', yaxis_title_text='Calories')
     
     return fig
 
 
-def create_water_gauge_chart(water_data: list) -> go.Figure:
-    """Create a circular donut chart showing daily water intake progress."""
-    if not water_data:
+# Water gauge status by progress percentage: (color, emoji, text) from each threshold up
+_WATER_TIER_THRESHOLDS = (0, 50, 80, 100)
+_WATER_TIERS = (
+    ('#EF4444', '🚰', 'Drink Up!'),        # Red
+    ('#F59E0B', '⚡', 'Keep Going!'),      # Orange
+    ('#3B82F6', '💪', 'Almost There!'),    # Blue
+    ('#10B981', '🎉', 'Goal Achieved!'),   # Green
+)
+
+
+@memoize_figure
+def create_water_gauge_chart(df: pd.DataFrame) -> dict:
+    """Create a circular donut chart showing daily water intake progress (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Water Intake", "No water data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(water_data)
-    df['intake_date'] = pd.to_datetime(df['intake_date']).dt.date
-    
     # Get today's water intake
-    today = datetime.now().date()
-    today_water = df[df['intake_date'] == today]['amount_ml'].sum()
+    today = np.datetime64(_now().date(), 'D')
+    today_water = int(df.loc[_days(df['intake_date']) == today, 'amount_ml'].sum())
     
     # Daily goal: 2500ml
     daily_goal = 2500
@@ -310,22 +431,8 @@ def create_water_gauge_chart(water_data: list) -> go.Figure:
     remaining = max(0, daily_goal - today_water)
     
     # Determine color based on progress
-    if percentage >= 100:
-        main_color = '#10B981'  # Green
-        status_emoji = '🎉'
-        status_text = 'Goal Achieved!'
-    elif percentage >= 80:
-        main_color = '#3B82F6'  # Blue
-        status_emoji = '💪'
-        status_text = 'Almost There!'
-    elif percentage >= 50:
-        main_color = '#F59E0B'  # Orange
-        status_emoji = '⚡'
-        status_text = 'Keep Going!'
-    else:
-        main_color = '#EF4444'  # Red
-        status_emoji = '🚰'
-        status_text = 'Drink Up!'
+    tier = max(bisect_right(_WATER_TIER_THRESHOLDS, percentage) - 1, 0)
+    main_color, status_emoji, status_text = _WATER_TIERS[tier]
     
     # Create donut chart
     if today_water >= daily_goal:
@@ -389,27 +496,34 @@ def create_water_gauge_chart(water_data: list) -> go.Figure:
     return fig
 
 
-def create_sleep_trend_chart(sleep_data: list) -> go.Figure:
-    """Create a line chart showing sleep hours with quality indicators."""
-    if not sleep_data:
+# Marker color per sleep quality score, indexed 0 (unknown) through 10
+_SLEEP_COLOR_LUT = np.array([
+    '#6B7280',
+    '#EF4444', '#EF4444', '#EF4444',
+    '#F59E0B', '#F59E0B',
+    '#3B82F6', '#3B82F6',
+    '#10B981', '#10B981', '#10B981'
+])
+
+
+@memoize_figure
+def create_sleep_trend_chart(df: pd.DataFrame) -> dict:
+    """Create a line chart showing sleep hours with quality indicators (as plotly JSON)."""
+    if df is None or df.empty:
         return create_empty_chart("Sleep Trends", "No sleep data available")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(sleep_data)
-    df['sleep_date'] = pd.to_datetime(df['sleep_date'])
     df = df.sort_values('sleep_date')
     
     # Get last 14 days
-    last_14_days = datetime.now().date() - timedelta(days=14)
-    df = df[df['sleep_date'].dt.date >= last_14_days]
+    last_14_days = np.datetime64(_now().date() - timedelta(days=14), 'D')
+    df = df[_days(df['sleep_date']) >= last_14_days]
     
     if df.empty:
         return create_empty_chart("Sleep Trends", "No sleep data in last 14 days")
     
-    # Map quality to colors
-    quality_map = {10: '#10B981', 9: '#10B981', 8: '#10B981', 7: '#3B82F6', 6: '#3B82F6', 
-                   5: '#F59E0B', 4: '#F59E0B', 3: '#EF4444', 2: '#EF4444', 1: '#EF4444'}
-    df['color'] = df['sleep_quality'].map(quality_map).fillna('#6B7280')
+    # Map quality to colors (missing quality falls into the grey 0 bucket)
+    quality = df['sleep_quality'].fillna(0).to_numpy().clip(0, 10).astype(np.int8)
+    colors = _SLEEP_COLOR_LUT[quality]
     
     # Create line chart
     fig = go.Figure()
@@ -418,7 +532,7 @@ def create_sleep_trend_chart(sleep_data: list) -> go.Figure:
         y=df['total_hours'],
         mode='lines+markers',
         line=dict(color='#8B5CF6', width=3),
-        marker=dict(size=12, color=df['color'], line=dict(color='white', width=2)),
+        marker=dict(size=12, color=colors, line=dict(color='white', width=2)),
         hovertemplate='<b>%{x|%b %d}</b><br>Sleep: %{y:.1f} hrs<extra></extra>'
     ))
     
@@ -426,18 +540,11 @@ def create_sleep_trend_chart(sleep_data: list) -> go.Figure:
     fig.add_hrect(y0=7, y1=9, fillcolor="#10B981", opacity=0.1, layer="below")
     
     fig.update_layout(
-        title='😴 Sleep Duration (Last 14 Days)',
-        xaxis_title='Date',
-        yaxis_title='Hours',
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40),
-        xaxis=dict(showgrid=True, gridcolor='#E5E7EB'),
-        yaxis=dict(showgrid=True, gridcolor='#E5E7EB', range=[0, 12]),
-        title_font=dict(size=16),
+        **_BASE_LAYOUT,
+        title_text='😴 Sleep Duration (Last 14 Days)',
         showlegend=False
     )
+    fig.update_layout(xaxis_title_text='Date', yaxis_title_text='Hours', yaxis_range=[0, 12])
     
     return fig
 
@@ -446,29 +553,92 @@ def create_sleep_trend_chart(sleep_data: list) -> go.Figure:
 # Dashboard Layout
 # ============================================================
 
+# Columns the charts, stats and update toast actually read, per dataset.
+# Free-text fields such as notes never enter the frames.
+_FRAME_COLUMNS = {
+    'workout_date': ('id', 'workout_date', 'workout_type', 'workout_name', 'duration_minutes'),
+    'meal_date': ('id', 'meal_date', 'meal_type', 'meal_name', 'calories', 'protein_g', 'carbs_g', 'fat_g'),
+    'log_date': ('id', 'log_date', 'weight_kg'),
+    'sleep_date': ('id', 'sleep_date', 'total_hours', 'sleep_quality'),
+    'intake_date': ('id', 'intake_date', 'amount_ml'),
+}
+
+
+def _to_frame(records, date_column: str) -> pd.DataFrame:
+    """Build a DataFrame of the used columns from API records, parsing dates once."""
+    if not records:
+        return pd.DataFrame()
+    df = pd.DataFrame(records, columns=_FRAME_COLUMNS[date_column])
+    if date_column in df:
+        # The API sends plain ISO dates, which NumPy's C parser handles
+        # directly; anything else raises instead of being guessed at
+        df[date_column] = df[date_column].to_numpy(dtype=object).astype('datetime64[D]')
+    return df
+
+
 def get_dashboard_data(user_id: int = 1):
-    """Fetch all data needed for the dashboard for a specific user."""
+    """
+    Fetch all data needed for the dashboard for a specific user.
+    
+    Returns workouts, meals, weight, sleep and water DataFrames with their
+    date columns already parsed, or five Nones if the backend is down.
+    """
+    fetchers = (
+        (get_workouts, 'workout_date'),
+        (get_meals, 'meal_date'),
+        (get_weight_logs, 'log_date'),
+        (get_sleep_records, 'sleep_date'),
+        (get_water_intakes, 'intake_date'),
+    )
+    
+    # The requests are independent, so run the health check and all five
+    # fetches concurrently: page load waits for the slowest one, not the sum
+    calls = {'health': check_backend_health}
+    for fetch, date_column in fetchers:
+        calls[date_column] = partial(fetch, user_id=user_id)
+    results = fetch_concurrently(calls)
+    
     # Check if backend is running
-    if not check_backend_health():
+    if not results['health']:
         return None, None, None, None, None
     
-    # Fetch data from API for the logged-in user
-    workouts = get_workouts(user_id=user_id) or []
-    meals = get_meals(user_id=user_id) or []
-    weight_logs = get_weight_logs(user_id=user_id) or []
-    sleep_records = get_sleep_records(user_id=user_id) or []
-    water_intakes = get_water_intakes(user_id=user_id) or []
-    
-    return workouts, meals, weight_logs, sleep_records, water_intakes
+    return tuple(_to_frame(results[date_column], date_column) for _, date_column in fetchers)
+
+
+def _fingerprint(df: pd.DataFrame) -> list:
+    """
+    Return [row count, max id, content hash] for a dataset frame.
+    
+    Count and max id flag added records; the hash also catches in-place
+    edits. It is a hex string so it survives the dcc.Store round trip.
+    """
+    max_id = int(df['id'].max()) if not df.empty and 'id' in df else 0
+    return [len(df), max_id, _data_fingerprint(df)]
+
+
+def get_data_counts(workouts, meals, weight_logs, sleep_records, water_intakes):
+    """Return per-dataset [count, max id, hash] fingerprints plus today's date, used to detect changes."""
+    return {
+        'workouts': _fingerprint(workouts),
+        'meals': _fingerprint(meals),
+        'weight': _fingerprint(weight_logs),
+        'sleep': _fingerprint(sleep_records),
+        'water': _fingerprint(water_intakes),
+        'date': _now().date().isoformat()
+    }
 
 
 def calculate_summary_stats(workouts, meals, sleep_records, water_intakes):
-    """Calculate summary statistics for the dashboard cards."""
-    today = datetime.now().date()
+    """Calculate summary statistics for the dashboard cards from parsed frames."""
+    today = _now().date()
     
     # Calculate start of current week (Monday)
     start_of_week = today - timedelta(days=today.weekday())
     
+    # Day-resolution bounds for vectorized date masks
+    today64 = np.datetime64(today, 'D')
+    week64 = np.datetime64(start_of_week, 'D')
+    
     # Default values
     stats = {
         'calories_today': 0,
@@ -477,51 +647,55 @@ def calculate_summary_stats(workouts, meals, sleep_records, water_intakes):
         'water_today': 0
     }
     
-    if meals:
-        df_meals = pd.DataFrame(meals)
-        df_meals['meal_date'] = pd.to_datetime(df_meals['meal_date']).dt.date
-        today_meals = df_meals[df_meals['meal_date'] == today]
-        stats['calories_today'] = int(today_meals['calories'].sum()) if not today_meals.empty else 0
+    if not meals.empty:
+        today_meals = _days(meals['meal_date']) == today64
+        stats['calories_today'] = int(meals.loc[today_meals, 'calories'].sum())
     
-    if workouts:
-        df_workouts = pd.DataFrame(workouts)
-        df_workouts['workout_date'] = pd.to_datetime(df_workouts['workout_date']).dt.date
+    if not workouts.empty:
         # Filter for this week (Monday to today)
-        week_workouts = df_workouts[df_workouts['workout_date'] >= start_of_week]
-        stats['workouts_week'] = len(week_workouts)
+        stats['workouts_week'] = int((_days(workouts['workout_date']) >= week64).sum())
     
-    if sleep_records:
-        df_sleep = pd.DataFrame(sleep_records)
-        stats['avg_sleep'] = round(df_sleep['total_hours'].mean(), 1)
+    if not sleep_records.empty:
+        avg_sleep = sleep_records['total_hours'].mean()
+        stats['avg_sleep'] = round(float(avg_sleep), 1) if pd.notna(avg_sleep) else 0
     
-    if water_intakes:
-        df_water = pd.DataFrame(water_intakes)
-        df_water['intake_date'] = pd.to_datetime(df_water['intake_date']).dt.date
-        today_water = df_water[df_water['intake_date'] == today]
-        stats['water_today'] = int(today_water['amount_ml'].sum()) if not today_water.empty else 0
+    if not water_intakes.empty:
+        today_water = _days(water_intakes['intake_date']) == today64
+        stats['water_today'] = int(water_intakes.loc[today_water, 'amount_ml'].sum())
     
     return stats
 
 
-def create_dashboard_navbar(username: str, role: str):
-    """Create the dashboard navbar with user info and logout."""
-    nav_items = [
+@lru_cache(maxsize=4)
+def _navbar_skeleton(role: str):
+    """Build the static nav items around the username label, once per role."""
+    leading = [
         dbc.NavItem(dbc.NavLink("Dashboard", href="/dashboard", active=True)),
         dbc.NavItem(dbc.NavLink("Enter Data", href="/data-entry")),
     ]
     
     # Add admin link for admins
     if role == "admin":
-        nav_items.append(dbc.NavItem(dbc.NavLink("Admin Panel", href="/admin")))
+        leading.append(dbc.NavItem(dbc.NavLink("Admin Panel", href="/admin")))
     
-    nav_items.extend([
-        dbc.NavItem(html.Span(f"👤 {username}", className="nav-link text-light")),
+    trailing = (
         dbc.NavItem(
             dbc.Button("🌓", id="theme-toggle-btn", color="link", 
                        className="text-light theme-toggle", title="Toggle Dark/Light Mode")
         ),
         dbc.NavItem(dbc.Button("Logout", id="logout-button", color="light", size="sm", className="ms-2")),
-    ])
+    )
+    return tuple(leading), trailing
+
+
+def create_dashboard_navbar(username: str, role: str):
+    """Create the dashboard navbar with user info and logout."""
+    leading, trailing = _navbar_skeleton(role)
+    nav_items = [
+        *leading,
+        dbc.NavItem(html.Span(f"👤 {username}", className="nav-link text-light")),
+        *trailing,
+    ]
     
     return dbc.Navbar(
         dbc.Container([
@@ -570,13 +744,14 @@ def create_dashboard_layout(auth_data=None):
     # Calculate summary stats
     stats = calculate_summary_stats(workouts, meals, sleep_records, water_intakes)
     
-    # Create charts
+    # Create the above-the-fold charts; rows 2 and 3 start as placeholders
+    # and are filled once they scroll into view (see dashboard_callbacks)
     weight_chart = create_weight_line_chart(weight_logs)
     workout_chart = create_workout_bar_chart(workouts)
-    macro_chart = create_macro_pie_chart(meals)
-    calorie_chart = create_calorie_area_chart(meals)
-    water_gauge = create_water_gauge_chart(water_intakes)
-    sleep_trend = create_sleep_trend_chart(sleep_records)
+    macro_chart = create_empty_chart("Macronutrients", "Loading...")
+    calorie_chart = create_empty_chart("Daily Calories", "Loading...")
+    water_gauge = create_empty_chart("Water Intake", "Loading...")
+    sleep_trend = create_empty_chart("Sleep Trends", "Loading...")
     
     return html.Div([
         # Navbar with user info and logout
@@ -589,7 +764,7 @@ def create_dashboard_layout(auth_data=None):
             dbc.Col([
                 html.H1("🏃 Health & Fitness Dashboard", className="mb-2"),
                 html.P(
-                    f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 
+                    f"Last updated: {_now().strftime('%Y-%m-%d %H:%M:%S')}", 
                     className="text-muted",
                     id="last-updated"
                 )
@@ -604,7 +779,8 @@ def create_dashboard_layout(auth_data=None):
                     f"{stats['calories_today']:,}", 
                     "kcal", 
                     "🔥",
-                    "danger"
+                    "danger",
+                    value_id="stat-calories-today"
                 ), 
                 xs=12, sm=6, md=3, className="mb-3"
             ),
@@ -614,7 +790,8 @@ def create_dashboard_layout(auth_data=None):
                     str(stats['workouts_week']), 
                     "sessions", 
                     "💪",
-                    "success"
+                    "success",
+                    value_id="stat-workouts-week"
                 ), 
                 xs=12, sm=6, md=3, className="mb-3"
             ),
@@ -624,7 +801,8 @@ def create_dashboard_layout(auth_data=None):
                     str(stats['avg_sleep']), 
                     "hours", 
                     "😴",
-                    "info"
+                    "info",
+                    value_id="stat-avg-sleep"
                 ), 
                 xs=12, sm=6, md=3, className="mb-3"
             ),
@@ -634,7 +812,8 @@ def create_dashboard_layout(auth_data=None):
                     f"{stats['water_today']:,}", 
                     "ml", 
                     "💧",
-                    "primary"
+                    "primary",
+                    value_id="stat-water-today"
                 ), 
                 xs=12, sm=6, md=3, className="mb-3"
             ),
@@ -651,11 +830,7 @@ def create_dashboard_layout(auth_data=None):
                             config={'displayModeBar': False}
                         )
                     ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
+                ], className="chart-container", style=_CARD_STYLE)
             ], xs=12, lg=6, className="mb-4"),
             dbc.Col([
                 dbc.Card([
@@ -666,81 +841,66 @@ def create_dashboard_layout(auth_data=None):
                             config={'displayModeBar': False}
                         )
                     ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
+                ], className="chart-container", style=_CARD_STYLE)
             ], xs=12, lg=6, className="mb-4"),
         ]),
         
-        # Charts Row 2: Macros Pie & Calorie Area
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id="macro-pie-chart",
-                            figure=macro_chart,
-                            config={'displayModeBar': False}
-                        )
-                    ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
-            ], xs=12, lg=4, className="mb-4"),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id="calorie-area-chart",
-                            figure=calorie_chart,
-                            config={'displayModeBar': False}
-                        )
-                    ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
-            ], xs=12, lg=8, className="mb-4"),
-        ]),
-        
-        # Charts Row 3: Water Gauge & Sleep Trend
-        dbc.Row([
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id="water-gauge-chart",
-                            figure=water_gauge,
-                            config={'displayModeBar': False}
-                        )
-                    ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
-            ], xs=12, lg=4, className="mb-4"),
-            dbc.Col([
-                dbc.Card([
-                    dbc.CardBody([
-                        dcc.Graph(
-                            id="sleep-trend-chart",
-                            figure=sleep_trend,
-                            config={'displayModeBar': False}
-                        )
-                    ])
-                ], className="chart-container", style={
-                    "borderRadius": "12px",
-                    "border": "none",
-                    "boxShadow": "0 2px 8px rgba(0,0,0,0.08)"
-                })
-            ], xs=12, lg=8, className="mb-4"),
-        ]),
+        # Lazily loaded charts (rows 2 and 3). No dcc.Loading here: these
+        # graphs are also outputs of the 2s refresh, which would flash a
+        # spinner on every tick; the "Loading..." placeholders cover it.
+        html.Div([
+            # Charts Row 2: Macros Pie & Calorie Area
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id="macro-pie-chart",
+                                figure=macro_chart,
+                                config={'displayModeBar': False}
+                            )
+                        ])
+                    ], className="chart-container", style=_CARD_STYLE)
+                ], xs=12, lg=4, className="mb-4"),
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id="calorie-area-chart",
+                                figure=calorie_chart,
+                                config={'displayModeBar': False}
+                            )
+                        ])
+                    ], className="chart-container", style=_CARD_STYLE)
+                ], xs=12, lg=8, className="mb-4"),
+            ]),
+            
+            # Charts Row 3: Water Gauge & Sleep Trend
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id="water-gauge-chart",
+                                figure=water_gauge,
+                                config={'displayModeBar': False}
+                            )
+                        ])
+                    ], className="chart-container", style=_CARD_STYLE)
+                ], xs=12, lg=4, className="mb-4"),
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            dcc.Graph(
+                                id="sleep-trend-chart",
+                                figure=sleep_trend,
+                                config={'displayModeBar': False}
+                            )
+                        ])
+                    ], className="chart-container", style=_CARD_STYLE)
+                ], xs=12, lg=8, className="mb-4"),
+            ]),
+        ], id="lazy-charts"),
         
         # Toast Notification for real-time updates
         # Toast Notification for real-time updates
@@ -774,13 +934,16 @@ def create_dashboard_layout(auth_data=None):
         ),
         
         # Store for tracking last data count
-        dcc.Store(id='last-data-count', data={
-            'workouts': 0,
-            'meals': 0,
-            'weight': 0,
-            'sleep': 0,
-            'water': 0
-        })
+        dcc.Store(id='last-data-count', data=get_data_counts(
+            workouts, meals, weight_logs, sleep_records, water_intakes
+        )),
+        
+        # Latest summary stats, rendered into the stat cards clientside
+        dcc.Store(id='dashboard-stats-store', data=stats),
+        
+        # Polls until the lazy chart rows are near the viewport, then stops
+        dcc.Interval(id='lazy-charts-poll', interval=250, n_intervals=0),
+        dcc.Store(id='lazy-charts-visible', data=False)
         
     ], fluid=True, className="p-4", style={"backgroundColor": "#F3F4F6", "minHeight": "calc(100vh - 56px)"})
     ])  # End of html.Div wrapper
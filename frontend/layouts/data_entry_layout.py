@@ -6,15 +6,75 @@ Accessible only to logged-in users.
 
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-from datetime import datetime
+import functools
+
+
+# Spacing class shared by every form field
+_MB3 = "mb-3"
+
+
+def _field(id: str, label: str, span: int, component=dbc.Input, **kwargs):
+    """Create a form-grid cell holding a label and a control."""
+    return html.Div([
+        dbc.Label(label),
+        component(id=id, className=_MB3, **kwargs),
+    ], className=f"span-{span}")
+
+
+# Select options shared by the entry forms (Dash only reads them)
+_BEVERAGE_OPTIONS = (
+    {"label": "Water", "value": "water"},
+    {"label": "Tea", "value": "tea"},
+    {"label": "Coffee", "value": "coffee"},
+    {"label": "Juice", "value": "juice"},
+)
+
+_MEAL_TYPE_OPTIONS = (
+    {"label": "Breakfast", "value": "breakfast"},
+    {"label": "Lunch", "value": "lunch"},
+    {"label": "Dinner", "value": "dinner"},
+    {"label": "Snack", "value": "snack"},
+)
+
+_WORKOUT_TYPE_OPTIONS = (
+    {"label": "Cardio", "value": "cardio"},
+    {"label": "Strength", "value": "strength"},
+    {"label": "Flexibility", "value": "flexibility"},
+    {"label": "Sports", "value": "sports"},
+)
+
+_INTENSITY_OPTIONS = (
+    {"label": "Low", "value": "low"},
+    {"label": "Medium", "value": "medium"},
+    {"label": "High", "value": "high"},
+)
+
+# Nav items before the username label, for regular users and admins
+_NAV_ITEMS_USER = (
+    dbc.NavItem(dbc.NavLink("Dashboard", href="/dashboard")),
+    dbc.NavItem(dbc.NavLink("Enter Data", href="/data-entry", active=True)),
+)
+_NAV_ITEMS_ADMIN = _NAV_ITEMS_USER + (
+    dbc.NavItem(dbc.NavLink("Admin Panel", href="/admin")),
+)
+
+# Nav items after the username label
+_NAV_ITEMS_TRAILING = (
+    dbc.NavItem(
+        dbc.Button("🌓", id="theme-toggle-btn", color="link", 
+                   className="text-light theme-toggle", title="Toggle Dark/Light Mode")
+    ),
+    dbc.NavItem(dbc.Button("Logout", id="logout-button", color="light", size="sm", className="ms-2")),
+)
 
 
 def create_data_entry_layout(auth_data=None):
     """Create the data entry page layout."""
     
     # Get user info
-    username = auth_data.get('username', 'User') if auth_data else 'User'
-    role = auth_data.get('role', 'user') if auth_data else 'user'
+    # Plain strings so the navbar cache keys stay hashable
+    username = str(auth_data.get('username', 'User')) if auth_data else 'User'
+    role = str(auth_data.get('role', 'user')) if auth_data else 'user'
     
     return html.Div([
         # Navbar
@@ -34,56 +94,66 @@ def create_data_entry_layout(auth_data=None):
             html.Div(id="data-entry-message", className="mb-3"),
             
             # Data entry tabs
-            dbc.Tabs([
-                # Weight Tab
-                dbc.Tab([
-                    create_weight_form()
-                ], label="⚖️ Weight", tab_id="weight-tab", className="p-4"),
-                
-                # Sleep Tab
-                dbc.Tab([
-                    create_sleep_form()
-                ], label="😴 Sleep", tab_id="sleep-tab", className="p-4"),
-                
-                # Water Tab
-                dbc.Tab([
-                    create_water_form()
-                ], label="💧 Water", tab_id="water-tab", className="p-4"),
-                
-                # Meals Tab
-                dbc.Tab([
-                    create_meal_form()
-                ], label="🍽️ Meals", tab_id="meals-tab", className="p-4"),
-                
-                # Workout Tab
-                dbc.Tab([
-                    create_workout_form()
-                ], label="💪 Workout", tab_id="workout-tab", className="p-4"),
-                
-            ], id="data-entry-tabs", active_tab="weight-tab", className="mb-4"),
+            create_data_entry_tabs(),
+            
+            # Tabs whose form has already been rendered
+            dcc.Store(id="data-entry-loaded-tabs", data=["weight-tab"]),
             
         ], fluid=True, className="p-4", style={"backgroundColor": "#F3F4F6", "minHeight": "calc(100vh - 56px)"})
     ])
 
 
-def create_data_entry_navbar(username: str, role: str):
-    """Create navbar for data entry page."""
-    nav_items = [
-        dbc.NavItem(dbc.NavLink("Dashboard", href="/dashboard")),
-        dbc.NavItem(dbc.NavLink("Enter Data", href="/data-entry", active=True)),
-    ]
-    
-    if role == "admin":
-        nav_items.append(dbc.NavItem(dbc.NavLink("Admin Panel", href="/admin")))
+@functools.lru_cache(maxsize=1)
+def create_data_entry_tabs():
+    """
+    Create the tabs holding the five entry forms.
     
-    nav_items.extend([
-        dbc.NavItem(html.Span(f"👤 {username}", className="nav-link text-light")),
-        dbc.NavItem(
-            dbc.Button("🌓", id="theme-toggle-btn", color="link", 
-                       className="text-light theme-toggle", title="Toggle Dark/Light Mode")
+    Only the Weight form is rendered up front; the other tabs start empty and
+    are filled the first time they are opened (see data_entry_callbacks).
+    Date/time defaults are filled in by the browser, so the tree is static
+    and built once per process.
+    """
+    return dbc.Tabs([
+        # Weight Tab
+        dbc.Tab(
+            html.Div(create_weight_form(), id="weight-tab-content"),
+            label="⚖️ Weight", tab_id="weight-tab", className="p-4"
         ),
-        dbc.NavItem(dbc.Button("Logout", id="logout-button", color="light", size="sm", className="ms-2")),
-    ])
+        
+        # Sleep Tab
+        dbc.Tab(
+            html.Div(id="sleep-tab-content"),
+            label="😴 Sleep", tab_id="sleep-tab", className="p-4"
+        ),
+        
+        # Water Tab
+        dbc.Tab(
+            html.Div(id="water-tab-content"),
+            label="💧 Water", tab_id="water-tab", className="p-4"
+        ),
+        
+        # Meals Tab
+        dbc.Tab(
+            html.Div(id="meals-tab-content"),
+            label="🍽️ Meals", tab_id="meals-tab", className="p-4"
+        ),
+        
+        # Workout Tab
+        dbc.Tab(
+            html.Div(id="workout-tab-content"),
+            label="💪 Workout", tab_id="workout-tab", className="p-4"
+        ),
+        
+    ], id="data-entry-tabs", active_tab="weight-tab", className="mb-4")
+
+
+@functools.lru_cache(maxsize=256)
+def create_data_entry_navbar(username: str, role: str):
+    """Create navbar for data entry page, cached per (username, role)."""
+    leading = _NAV_ITEMS_ADMIN if role == "admin" else _NAV_ITEMS_USER
+    nav_items = leading + (
+        dbc.NavItem(html.Span(f"👤 {username}", className="nav-link text-light")),
+    ) + _NAV_ITEMS_TRAILING
     
     return dbc.Navbar(
         dbc.Container([
@@ -91,7 +161,7 @@ def create_data_entry_navbar(username: str, role: str):
                 html.Span("🏃 ", style={"fontSize": "1.5rem"}),
                 "Health & Fitness Monitor"
             ], href="/dashboard", className="fs-4 fw-bold"),
-            dbc.Nav(nav_items, navbar=True, className="ms-auto")
+            dbc.Nav(list(nav_items), navbar=True, className="ms-auto")
         ], fluid=True),
         color="primary",
         dark=True,
@@ -99,408 +169,141 @@ def create_data_entry_navbar(username: str, role: str):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_weight_form():
     """Create weight entry form."""
     return dbc.Card([
         dbc.CardBody([
             html.H5("Log Your Weight", className="card-title mb-4"),
             
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Date"),
-                    dbc.Input(
-                        id="weight-date",
-                        type="date",
-                        value=datetime.now().strftime("%Y-%m-%d"),
-                        className="mb-3"
-                    ),
-                ], md=6),
-                dbc.Col([
-                    dbc.Label("Weight (kg)"),
-                    dbc.Input(
-                        id="weight-kg",
-                        type="number",
-                        placeholder="e.g., 70.5",
-                        min=20,
-                        max=300,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=6),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Body Fat % (optional)"),
-                    dbc.Input(
-                        id="weight-body-fat",
-                        type="number",
-                        placeholder="e.g., 18.5",
-                        min=1,
-                        max=60,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=6),
-                dbc.Col([
-                    dbc.Label("Notes (optional)"),
-                    dbc.Input(
-                        id="weight-notes",
-                        type="text",
-                        placeholder="Any notes...",
-                        className="mb-3"
-                    ),
-                ], md=6),
-            ]),
+            html.Div([
+                _field("weight-date", "Date", 6, type="date"),
+                _field("weight-kg", "Weight (kg)", 6, type="number",
+                       placeholder="e.g., 70.5", min=20, max=300, step=0.1),
+                
+                _field("weight-body-fat", "Body Fat % (optional)", 6, type="number",
+                       placeholder="e.g., 18.5", min=1, max=60, step=0.1),
+                _field("weight-notes", "Notes (optional)", 6, type="text",
+                       placeholder="Any notes..."),
+            ], className="form-grid"),
             
             dbc.Button("Save Weight", id="save-weight-btn", color="primary", className="mt-2")
         ])
     ])
 
 
+@functools.lru_cache(maxsize=1)
 def create_sleep_form():
     """Create sleep entry form."""
     return dbc.Card([
         dbc.CardBody([
             html.H5("Log Your Sleep", className="card-title mb-4"),
             
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Date"),
-                    dbc.Input(
-                        id="sleep-date",
-                        type="date",
-                        value=datetime.now().strftime("%Y-%m-%d"),
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Bed Time"),
-                    dbc.Input(
-                        id="sleep-bed-time",
-                        type="time",
-                        value="23:00",
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Wake Time"),
-                    dbc.Input(
-                        id="sleep-wake-time",
-                        type="time",
-                        value="07:00",
-                        className="mb-3"
-                    ),
-                ], md=4),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Total Hours"),
-                    dbc.Input(
-                        id="sleep-hours",
-                        type="number",
-                        placeholder="e.g., 7.5",
-                        min=0,
-                        max=24,
-                        step=0.5,
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Sleep Quality (1-10)"),
-                    dbc.Input(
-                        id="sleep-quality",
-                        type="number",
-                        placeholder="1-10",
-                        min=1,
-                        max=10,
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Notes (optional)"),
-                    dbc.Input(
-                        id="sleep-notes",
-                        type="text",
-                        placeholder="Any notes...",
-                        className="mb-3"
-                    ),
-                ], md=4),
-            ]),
+            html.Div([
+                _field("sleep-date", "Date", 4, type="date"),
+                _field("sleep-bed-time", "Bed Time", 4, type="time", value="23:00"),
+                _field("sleep-wake-time", "Wake Time", 4, type="time", value="07:00"),
+                
+                _field("sleep-hours", "Total Hours", 4, type="number",
+                       placeholder="e.g., 7.5", min=0, max=24, step=0.5),
+                _field("sleep-quality", "Sleep Quality (1-10)", 4, type="number",
+                       placeholder="1-10", min=1, max=10),
+                _field("sleep-notes", "Notes (optional)", 4, type="text",
+                       placeholder="Any notes..."),
+            ], className="form-grid"),
             
             dbc.Button("Save Sleep", id="save-sleep-btn", color="primary", className="mt-2")
         ])
     ])
 
 
+@functools.lru_cache(maxsize=1)
 def create_water_form():
     """Create water intake entry form."""
     return dbc.Card([
         dbc.CardBody([
             html.H5("Log Water Intake", className="card-title mb-4"),
             
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Date"),
-                    dbc.Input(
-                        id="water-date",
-                        type="date",
-                        value=datetime.now().strftime("%Y-%m-%d"),
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Time"),
-                    dbc.Input(
-                        id="water-time",
-                        type="time",
-                        value=datetime.now().strftime("%H:%M"),
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Amount (ml)"),
-                    dbc.Input(
-                        id="water-amount",
-                        type="number",
-                        placeholder="e.g., 250",
-                        min=50,
-                        max=2000,
-                        step=50,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Beverage Type"),
-                    dbc.Select(
-                        id="water-beverage",
-                        options=[
-                            {"label": "Water", "value": "water"},
-                            {"label": "Tea", "value": "tea"},
-                            {"label": "Coffee", "value": "coffee"},
-                            {"label": "Juice", "value": "juice"},
-                        ],
-                        value="water",
-                        className="mb-3"
-                    ),
-                ], md=3),
-            ]),
+            html.Div([
+                _field("water-date", "Date", 3, type="date"),
+                _field("water-time", "Time", 3, type="time"),
+                _field("water-amount", "Amount (ml)", 3, type="number",
+                       placeholder="e.g., 250", min=50, max=2000, step=50),
+                _field("water-beverage", "Beverage Type", 3, dbc.Select,
+                       options=_BEVERAGE_OPTIONS, value="water"),
+            ], className="form-grid"),
             
             # Quick add buttons
             html.Div([
                 html.Small("Quick Add: ", className="text-muted me-2"),
-                dbc.Button("250ml", id="water-quick-250", color="outline-primary", size="sm", className="me-2"),
-                dbc.Button("500ml", id="water-quick-500", color="outline-primary", size="sm", className="me-2"),
-                dbc.Button("1L", id="water-quick-1000", color="outline-primary", size="sm"),
-            ], className="mb-3"),
+                dbc.Button("250ml", id={"type": "water-quick", "amount": 250}, color="outline-primary", size="sm", className="me-2"),
+                dbc.Button("500ml", id={"type": "water-quick", "amount": 500}, color="outline-primary", size="sm", className="me-2"),
+                dbc.Button("1L", id={"type": "water-quick", "amount": 1000}, color="outline-primary", size="sm"),
+            ], className=_MB3),
             
             dbc.Button("Save Water Intake", id="save-water-btn", color="primary", className="mt-2")
         ])
     ])
 
 
+@functools.lru_cache(maxsize=1)
 def create_meal_form():
     """Create meal entry form."""
     return dbc.Card([
         dbc.CardBody([
             html.H5("Log a Meal", className="card-title mb-4"),
             
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Date"),
-                    dbc.Input(
-                        id="meal-date",
-                        type="date",
-                        value=datetime.now().strftime("%Y-%m-%d"),
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Meal Type"),
-                    dbc.Select(
-                        id="meal-type",
-                        options=[
-                            {"label": "Breakfast", "value": "breakfast"},
-                            {"label": "Lunch", "value": "lunch"},
-                            {"label": "Dinner", "value": "dinner"},
-                            {"label": "Snack", "value": "snack"},
-                        ],
-                        value="breakfast",
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Meal Name"),
-                    dbc.Input(
-                        id="meal-name",
-                        type="text",
-                        placeholder="e.g., Oatmeal with fruits",
-                        className="mb-3"
-                    ),
-                ], md=4),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Calories"),
-                    dbc.Input(
-                        id="meal-calories",
-                        type="number",
-                        placeholder="e.g., 350",
-                        min=0,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Protein (g)"),
-                    dbc.Input(
-                        id="meal-protein",
-                        type="number",
-                        placeholder="e.g., 15",
-                        min=0,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Carbs (g)"),
-                    dbc.Input(
-                        id="meal-carbs",
-                        type="number",
-                        placeholder="e.g., 45",
-                        min=0,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Fat (g)"),
-                    dbc.Input(
-                        id="meal-fat",
-                        type="number",
-                        placeholder="e.g., 10",
-                        min=0,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=3),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Notes (optional)"),
-                    dbc.Textarea(
-                        id="meal-notes",
-                        placeholder="Any notes about this meal...",
-                        className="mb-3"
-                    ),
-                ])
-            ]),
+            html.Div([
+                _field("meal-date", "Date", 4, type="date"),
+                _field("meal-type", "Meal Type", 4, dbc.Select,
+                       options=_MEAL_TYPE_OPTIONS, value="breakfast"),
+                _field("meal-name", "Meal Name", 4, type="text",
+                       placeholder="e.g., Oatmeal with fruits"),
+                
+                _field("meal-calories", "Calories", 3, type="number",
+                       placeholder="e.g., 350", min=0),
+                _field("meal-protein", "Protein (g)", 3, type="number",
+                       placeholder="e.g., 15", min=0, step=0.1),
+                _field("meal-carbs", "Carbs (g)", 3, type="number",
+                       placeholder="e.g., 45", min=0, step=0.1),
+                _field("meal-fat", "Fat (g)", 3, type="number",
+                       placeholder="e.g., 10", min=0, step=0.1),
+                
+                _field("meal-notes", "Notes (optional)", 12, dbc.Textarea,
+                       placeholder="Any notes about this meal..."),
+            ], className="form-grid"),
             
             dbc.Button("Save Meal", id="save-meal-btn", color="primary", className="mt-2")
         ])
     ])
 
 
+@functools.lru_cache(maxsize=1)
 def create_workout_form():
     """Create workout entry form."""
     return dbc.Card([
         dbc.CardBody([
             html.H5("Log a Workout", className="card-title mb-4"),
             
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Date"),
-                    dbc.Input(
-                        id="workout-date",
-                        type="date",
-                        value=datetime.now().strftime("%Y-%m-%d"),
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Workout Type"),
-                    dbc.Select(
-                        id="workout-type",
-                        options=[
-                            {"label": "Cardio", "value": "cardio"},
-                            {"label": "Strength", "value": "strength"},
-                            {"label": "Flexibility", "value": "flexibility"},
-                            {"label": "Sports", "value": "sports"},
-                        ],
-                        value="cardio",
-                        className="mb-3"
-                    ),
-                ], md=4),
-                dbc.Col([
-                    dbc.Label("Workout Name"),
-                    dbc.Input(
-                        id="workout-name",
-                        type="text",
-                        placeholder="e.g., Morning Run",
-                        className="mb-3"
-                    ),
-                ], md=4),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Duration (minutes)"),
-                    dbc.Input(
-                        id="workout-duration",
-                        type="number",
-                        placeholder="e.g., 45",
-                        min=1,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Calories Burned"),
-                    dbc.Input(
-                        id="workout-calories",
-                        type="number",
-                        placeholder="e.g., 300",
-                        min=0,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Distance (km) - optional"),
-                    dbc.Input(
-                        id="workout-distance",
-                        type="number",
-                        placeholder="e.g., 5.0",
-                        min=0,
-                        step=0.1,
-                        className="mb-3"
-                    ),
-                ], md=3),
-                dbc.Col([
-                    dbc.Label("Intensity"),
-                    dbc.Select(
-                        id="workout-intensity",
-                        options=[
-                            {"label": "Low", "value": "low"},
-                            {"label": "Medium", "value": "medium"},
-                            {"label": "High", "value": "high"},
-                        ],
-                        value="medium",
-                        className="mb-3"
-                    ),
-                ], md=3),
-            ]),
-            
-            dbc.Row([
-                dbc.Col([
-                    dbc.Label("Notes (optional)"),
-                    dbc.Textarea(
-                        id="workout-notes",
-                        placeholder="Any notes about this workout...",
-                        className="mb-3"
-                    ),
-                ])
-            ]),
+            html.Div([
+                _field("workout-date", "Date", 4, type="date"),
+                _field("workout-type", "Workout Type", 4, dbc.Select,
+                       options=_WORKOUT_TYPE_OPTIONS, value="cardio"),
+                _field("workout-name", "Workout Name", 4, type="text",
+                       placeholder="e.g., Morning Run"),
+                
+                _field("workout-duration", "Duration (minutes)", 3, type="number",
+                       placeholder="e.g., 45", min=1),
+                _field("workout-calories", "Calories Burned", 3, type="number",
+                       placeholder="e.g., 300", min=0),
+                _field("workout-distance", "Distance (km) - optional", 3, type="number",
+                       placeholder="e.g., 5.0", min=0, step=0.1),
+                _field("workout-intensity", "Intensity", 3, dbc.Select,
+                       options=_INTENSITY_OPTIONS, value="medium"),
+                
+                _field("workout-notes", "Notes (optional)", 12, dbc.Textarea,
+                       placeholder="Any notes about this workout..."),
+            ], className="form-grid"),
             
             dbc.Button("Save Workout", id="save-workout-btn", color="primary", className="mt-2")
         ])
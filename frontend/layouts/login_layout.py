@@ -8,7 +8,12 @@ import dash_bootstrap_components as dbc
 
 
 def create_login_layout():
-    """Create the login page layout."""
+    """Return the login page layout (static, built once at import)."""
+    return _LOGIN_LAYOUT
+
+
+def _build_login_layout():
+    """Build the login page component tree."""
     return html.Div([
         # Center container
         dbc.Container([
@@ -19,7 +24,7 @@ def create_login_layout():
                         dbc.CardBody([
                             # Logo/Title
                             html.Div([
-                                html.Span("🏃", style={"fontSize": "3rem"}),
+                                html.Span("🏃", className="brand-emoji"),
                                 html.H2("Health & Fitness Monitor", 
                                        className="mt-2 mb-4 text-center fw-bold text-primary")
                             ], className="text-center mb-4"),
@@ -92,17 +97,13 @@ def create_login_layout():
                             ], className="text-center")
                             
                         ], className="p-4")
-                    ], className="shadow-lg", style={
-                        "borderRadius": "16px",
-                        "border": "none",
-                        "maxWidth": "400px",
-                        "margin": "0 auto"
-                    })
+                    ], className="shadow-lg login-card")
                 ], width=12, md=6, lg=4, className="mx-auto")
             ], className="justify-content-center align-items-center", 
                style={"minHeight": "100vh"})
         ], fluid=True)
-    ], style={
-        "background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
-        "minHeight": "100vh"
-    })
+    ], className="login-bg")
+
+
+# The login page has no per-request inputs, so it is built a single time
+_LOGIN_LAYOUT = _build_login_layout()
@@ -8,7 +8,12 @@ import dash_bootstrap_components as dbc
 
 
 def create_register_layout():
-    """Create the registration page layout."""
+    """Return the registration page layout (static, built once at import)."""
+    return _REGISTER_LAYOUT
+
+
+def _build_register_layout():
+    """Build the registration page component tree."""
     return html.Div([
         # Center container
         dbc.Container([
@@ -19,7 +24,7 @@ def create_register_layout():
                         dbc.CardBody([
                             # Logo/Title
                             html.Div([
-                                html.Span("🏃", style={"fontSize": "3rem"}),
+                                html.Span("🏃", className="brand-emoji"),
                                 html.H2("Create Account", 
                                        className="mt-2 mb-2 text-center fw-bold text-primary"),
                                 html.P("Join Health & Fitness Monitor", 
@@ -151,17 +156,13 @@ def create_register_layout():
                             ], className="mt-3")
                             
                         ], className="p-4")
-                    ], className="shadow-lg", style={
-                        "borderRadius": "16px",
-                        "border": "none",
-                        "maxWidth": "450px",
-                        "margin": "0 auto"
-                    })
+                    ], className="shadow-lg login-card register-card")
                 ], width=12, md=8, lg=5, className="mx-auto")
             ], className="justify-content-center align-items-center py-4", 
                style={"minHeight": "100vh"})
         ], fluid=True)
-    ], style={
-        "background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
-        "minHeight": "100vh"
-    })
+    ], className="login-bg")
+
+
+# The register page has no per-request inputs, so it is built a single time
+_REGISTER_LAYOUT = _build_register_layout()
@@ -5,116 +5,287 @@ Provides functions to fetch data for the dashboard.
 Includes authentication token handling.
 """
 
+import atexit
+import json
+import logging
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from typing import Optional, List, Dict, Any, Callable, Union
 from datetime import date
 
+# orjson is an optional speedup for encoding and decoding API JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 # Backend API base URL
 API_BASE_URL = "http://localhost:8000/api"
+# Backend root, answered by the health check route
+_HEALTH_URL = API_BASE_URL.rsplit("/api", 1)[0] + "/"
 
 # Token storage (simple in-memory for academic demo)
-# In production, use secure storage
-_auth_token: Optional[str] = None
+# In production, use secure storage. Held in context variables so one
+# request's login can't leak its token into a concurrent request.
+_auth_token: ContextVar[Optional[str]] = ContextVar("auth_token", default=None)
+# Authorization header for the current token, built once when it is set
+_auth_headers: ContextVar[Dict[str, str]] = ContextVar("auth_headers", default={})
+
+# Transient failures (backend restarting, proxy hiccups) are retried with a
+# short backoff. POST isn't idempotent here, so it is never retried.
+_retry = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "PUT", "DELETE"}),
+    raise_on_status=False
+)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_retry)
+
+
+class _BaseUrlSession(requests.Session):
+    """Session that resolves endpoint paths ("/workouts/") against a base URL."""
+    
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url
+    
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = self.base_url + url
+        return super().request(method, url, *args, **kwargs)
+
+
+# One pooled session so backend calls reuse keep-alive connections
+# instead of opening a new TCP connection per request. It is shared by all
+# users, so the Authorization header is passed per request, never set on it.
+_session = _BaseUrlSession(API_BASE_URL)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+atexit.register(_session.close)
+
+# Health probes must fail fast while the backend is down, so they go through
+# their own small session with no retries or backoff
+_probe_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+_probe_session = requests.Session()
+_probe_session.mount("http://", _probe_adapter)
+_probe_session.mount("https://", _probe_adapter)
+atexit.register(_probe_session.close)
 
 
 def set_auth_token(token: str) -> None:
-    """Store the authentication token."""
-    global _auth_token
-    _auth_token = token
+    """Store the authentication token and its Authorization header."""
+    _auth_token.set(token)
+    _auth_headers.set({"Authorization": f"Bearer {token}"} if token else {})
 
 
 def get_auth_token() -> Optional[str]:
     """Get the stored authentication token."""
-    return _auth_token
+    return _auth_token.get()
 
 
 def clear_auth_token() -> None:
     """Clear the authentication token (logout)."""
-    global _auth_token
-    _auth_token = None
+    _auth_token.set(None)
+    _auth_headers.set({})
 
 
 def _get_auth_headers() -> Dict[str, str]:
     """Get authorization headers if token is set."""
-    if _auth_token:
-        return {"Authorization": f"Bearer {_auth_token}"}
-    return {}
+    return _auth_headers.get()
 
 
 # ============================================================
 # Helper Functions
 # ============================================================
 
-def _handle_response(response: requests.Response) -> Optional[Any]:
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_CONN_ERR_MSG = f"Connection Error: Cannot connect to backend at {API_BASE_URL}"
+_DEFAULT_TIMEOUT = 10  # seconds, for regular API calls
+_HEALTH_TIMEOUT = 2  # seconds, for the health probe
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request body as JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _request(method: str, endpoint: str, **kwargs) -> Optional[requests.Response]:
+    """
+    Send a request on the pooled session. Transient failures are retried by
+    the session adapter; returns None if the backend still can't be reached.
+    """
+    kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
+    auth_headers = _get_auth_headers()
+    if auth_headers:
+        kwargs["headers"] = {**auth_headers, **(kwargs.get("headers") or {})}
+    try:
+        return _session.request(method, endpoint, **kwargs)
+    except requests.exceptions.ConnectionError:
+        logger.warning(_CONN_ERR_MSG)
+    except requests.exceptions.RequestException as e:
+        logger.warning("API Error: %s", e)
+    return None
+
+
+def _handle_response(response: Optional[requests.Response]) -> Optional[Any]:
     """Handle API response and return JSON data or None on error."""
+    if response is None:
+        return None
     try:
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     except requests.exceptions.RequestException as e:
-        print(f"API Error: {e}")
+        logger.warning("API Error: %s", e)
         return None
     except ValueError:
-        print("Error: Invalid JSON response")
+        logger.warning("Invalid JSON response")
         return None
 
 
 def _get(endpoint: str, params: Optional[Dict] = None) -> Optional[Any]:
     """Make a GET request to the API with auth token."""
-    try:
-        response = requests.get(
-            f"{API_BASE_URL}{endpoint}", 
-            params=params, 
-            headers=_get_auth_headers(),
-            timeout=10
-        )
-        return _handle_response(response)
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return None
+    return _handle_response(_request("GET", endpoint, params=params))
 
 
-def _post(endpoint: str, data: Dict) -> Optional[Any]:
-    """Make a POST request to the API with auth token."""
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}{endpoint}", 
-            json=data, 
-            headers=_get_auth_headers(),
-            timeout=10
-        )
-        return _handle_response(response)
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return None
+def _post(endpoint: str, data: Union[Dict, bytes]) -> Optional[Any]:
+    """Make a POST request to the API with auth token (data may be pre-encoded JSON)."""
+    response = _request(
+        "POST", endpoint,
+        data=data if isinstance(data, bytes) else _json_dumps(data),
+        headers=_JSON_HEADERS
+    )
+    # Cached lists for this resource are stale after a write
+    invalidate_cache(endpoint)
+    return _handle_response(response)
 
 
 def _put(endpoint: str, data: Dict) -> Optional[Any]:
     """Make a PUT request to the API with auth token."""
-    try:
-        response = requests.put(
-            f"{API_BASE_URL}{endpoint}", 
-            json=data, 
-            headers=_get_auth_headers(),
-            timeout=10
-        )
-        return _handle_response(response)
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return None
+    response = _request("PUT", endpoint, data=_json_dumps(data), headers=_JSON_HEADERS)
+    invalidate_cache(endpoint)
+    return _handle_response(response)
 
 
 def _delete(endpoint: str) -> bool:
     """Make a DELETE request to the API with auth token."""
-    try:
-        response = requests.delete(
-            f"{API_BASE_URL}{endpoint}", 
-            headers=_get_auth_headers(),
-            timeout=10
-        )
-        return response.status_code == 200
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return False
+    response = _request("DELETE", endpoint)
+    invalidate_cache(endpoint)
+    return response is not None and response.status_code == 200
+
+
+def _params(**kwargs) -> Dict[str, Any]:
+    """Build query params from keyword arguments, leaving out the ones that are None."""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+def _encode_payload(fields: tuple, values: Dict, defaults: Optional[Dict] = None) -> bytes:
+    """
+    Encode the given fields of a create payload straight to JSON bytes,
+    skipping None values, in a single pass over the field tuple.
+    """
+    defaults = defaults or {}
+    payload = {}
+    for name in fields:
+        value = values.get(name, defaults.get(name))
+        if value is not None:
+            payload[name] = value
+    return _json_dumps(payload)
+
+
+# Endpoint families fetched together (health probe, the five datasets and
+# users); the shared fetch pool gets one worker per family
+_FETCH_FAMILIES = ("/", "/workouts", "/nutrition", "/sleep", "/water", "/weight", "/users")
+_fetch_executor = ThreadPoolExecutor(max_workers=len(_FETCH_FAMILIES), thread_name_prefix="api-fetch")
+atexit.register(_fetch_executor.shutdown, wait=False)
+
+
+def fetch_concurrently(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run independent API calls concurrently and return their results by name.
+    
+    Each call blocks on a backend round trip, so overlapping them on the
+    pooled session makes a page load wait for the slowest call, not the sum.
+    Calls run on one module-level pool instead of a new one per call, each in
+    a copy of the caller's context so they send the caller's auth token.
+    """
+    futures = {name: _fetch_executor.submit(copy_context().run, call) for name, call in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+# ============================================================
+# Response Cache
+# ============================================================
+
+# Short-lived cache for list endpoints polled by the dashboard interval.
+# Keyed by (endpoint, params) only and shared by every session: the cached
+# endpoints don't depend on the token, and per-user lists are kept apart by
+# their user_id param. Don't route token-dependent endpoints through it.
+CACHE_TTL = 5  # seconds
+# Longer TTL for read-only aggregates (analytics, stats, trends, profiles)
+AGGREGATE_CACHE_TTL = 15  # seconds
+# User profiles rarely change within a session; writes to /users drop them anyway
+USER_CACHE_TTL = 60  # seconds
+CACHE_MAXSIZE = 1024
+_response_cache: Dict[tuple, tuple] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached_get(endpoint: str, params: Optional[Dict] = None, ttl: float = CACHE_TTL) -> Optional[Any]:
+    """GET through the response cache; failed requests are not cached."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    now = time.monotonic()
+    
+    with _cache_lock:
+        cached = _response_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+    
+    data = _get(endpoint, params)
+    if data is not None:
+        with _cache_lock:
+            if len(_response_cache) >= CACHE_MAXSIZE:
+                for stale_key in [k for k, (expires, _) in _response_cache.items() if expires <= now]:
+                    del _response_cache[stale_key]
+                if len(_response_cache) >= CACHE_MAXSIZE:
+                    _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[key] = (now + ttl, data)
+    return data
+
+
+# Families computed from other data (and the backend's write log), which
+# go stale whenever any resource is written
+_DERIVED_FAMILIES = ("/analytics", "/activity")
+
+
+def invalidate_cache(endpoint: Optional[str] = None) -> None:
+    """
+    Drop cached responses for an endpoint family (e.g. "/workouts") and the
+    derived analytics/activity families, or everything.
+    """
+    with _cache_lock:
+        if endpoint is None:
+            _response_cache.clear()
+            return
+        families = ("/" + endpoint.strip("/").split("/")[0],) + _DERIVED_FAMILIES
+        for key in [k for k in _response_cache if k[0].startswith(families)]:
+            del _response_cache[key]
 
 
 # ============================================================
@@ -127,21 +298,16 @@ def login(username: str, password: str) -> Optional[Dict]:
     Returns token data on success, None on failure.
     Token is automatically stored for subsequent requests.
     """
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/auth/login",
-            data={"username": username, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=10
-        )
-        if response.status_code == 200:
-            token_data = response.json()
-            set_auth_token(token_data.get("access_token", ""))
-            return token_data
-        return None
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return None
+    response = _request(
+        "POST", "/auth/login",
+        data={"username": username, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"}
+    )
+    if response is not None and response.status_code == 200:
+        token_data = _json_loads(response.content)
+        set_auth_token(token_data.get("access_token", ""))
+        return token_data
+    return None
 
 
 def logout() -> None:
@@ -168,16 +334,9 @@ def register(username: str, email: str, password: str,
     if last_name:
         data["last_name"] = last_name
     
-    try:
-        response = requests.post(
-            f"{API_BASE_URL}/auth/register",
-            json=data,
-            timeout=10
-        )
-        return _handle_response(response)
-    except requests.exceptions.ConnectionError:
-        print(f"Connection Error: Cannot connect to backend at {API_BASE_URL}")
-        return None
+    return _handle_response(
+        _request("POST", "/auth/register", data=_json_dumps(data), headers=_JSON_HEADERS)
+    )
 
 
 # ============================================================
@@ -186,22 +345,22 @@ def register(username: str, email: str, password: str,
 
 def get_dashboard_summary() -> Optional[Dict]:
     """Fetch complete dashboard summary data."""
-    return _get("/analytics/dashboard")
+    return _cached_get("/analytics/dashboard", ttl=AGGREGATE_CACHE_TTL)
 
 
 def get_weekly_stats() -> Optional[Dict]:
     """Fetch weekly statistics."""
-    return _get("/analytics/weekly")
+    return _cached_get("/analytics/weekly", ttl=AGGREGATE_CACHE_TTL)
 
 
 def get_monthly_stats() -> Optional[Dict]:
     """Fetch monthly statistics."""
-    return _get("/analytics/monthly")
+    return _cached_get("/analytics/monthly", ttl=AGGREGATE_CACHE_TTL)
 
 
 def get_calorie_data() -> Optional[Dict]:
     """Fetch calorie balance data."""
-    return _get("/analytics/calories")
+    return _cached_get("/analytics/calories", ttl=AGGREGATE_CACHE_TTL)
 
 
 # ============================================================
@@ -215,7 +374,7 @@ def get_users() -> Optional[List[Dict]]:
 
 def get_user(user_id: int) -> Optional[Dict]:
     """Fetch a single user by ID."""
-    return _get(f"/users/{user_id}")
+    return _cached_get(f"/users/{user_id}", ttl=USER_CACHE_TTL)
 
 
 def create_user(user_data: Dict) -> Optional[Dict]:
@@ -239,10 +398,7 @@ def delete_user(user_id: int) -> bool:
 
 def get_workouts(user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> Optional[List[Dict]]:
     """Fetch all workouts with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if user_id:
-        params["user_id"] = user_id
-    return _get("/workouts/", params)
+    return _cached_get("/workouts/", _params(skip=skip, limit=limit, user_id=user_id))
 
 
 def get_workout(workout_id: int) -> Optional[Dict]:
@@ -250,22 +406,24 @@ def get_workout(workout_id: int) -> Optional[Dict]:
     return _get(f"/workouts/{workout_id}")
 
 
+# Fields accepted by create_workout(**kwargs)
+_WORKOUT_FIELDS = (
+    "user_id",
+    "workout_date",
+    "workout_type",
+    "workout_name",
+    "duration_minutes",
+    "calories_burned",
+    "distance_km",
+    "intensity",
+    "notes",
+)
+
+
 def create_workout(workout_data: Dict = None, **kwargs) -> Optional[Dict]:
     """Create a new workout. Accepts dict or keyword arguments."""
     if workout_data is None:
-        workout_data = {
-            "user_id": kwargs.get("user_id"),
-            "workout_date": kwargs.get("workout_date"),
-            "workout_type": kwargs.get("workout_type"),
-            "workout_name": kwargs.get("workout_name"),
-            "duration_minutes": kwargs.get("duration_minutes"),
-            "calories_burned": kwargs.get("calories_burned"),
-            "distance_km": kwargs.get("distance_km"),
-            "intensity": kwargs.get("intensity"),
-            "notes": kwargs.get("notes")
-        }
-        # Remove None values
-        workout_data = {k: v for k, v in workout_data.items() if v is not None}
+        return _post("/workouts/", _encode_payload(_WORKOUT_FIELDS, kwargs))
     return _post("/workouts/", workout_data)
 
 
@@ -281,7 +439,7 @@ def delete_workout(workout_id: int) -> bool:
 
 def get_workout_summary(user_id: int = 1) -> Optional[Dict]:
     """Fetch workout summary statistics."""
-    return _get("/workouts/summary/", {"user_id": user_id})
+    return _cached_get("/workouts/summary/", {"user_id": user_id}, ttl=AGGREGATE_CACHE_TTL)
 
 
 # ============================================================
@@ -290,10 +448,7 @@ def get_workout_summary(user_id: int = 1) -> Optional[Dict]:
 
 def get_meals(user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> Optional[List[Dict]]:
     """Fetch all meals with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if user_id:
-        params["user_id"] = user_id
-    return _get("/nutrition/", params)
+    return _cached_get("/nutrition/", _params(skip=skip, limit=limit, user_id=user_id))
 
 
 def get_meal(meal_id: int) -> Optional[Dict]:
@@ -301,22 +456,25 @@ def get_meal(meal_id: int) -> Optional[Dict]:
     return _get(f"/nutrition/{meal_id}")
 
 
+# Fields accepted by create_meal(**kwargs)
+_MEAL_FIELDS = (
+    "user_id",
+    "meal_date",
+    "meal_type",
+    "meal_name",
+    "calories",
+    "protein_g",
+    "carbs_g",
+    "fat_g",
+    "notes",
+)
+_MEAL_DEFAULTS = {"calories": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0}
+
+
 def create_meal(meal_data: Dict = None, **kwargs) -> Optional[Dict]:
     """Create a new meal. Accepts dict or keyword arguments."""
     if meal_data is None:
-        meal_data = {
-            "user_id": kwargs.get("user_id"),
-            "meal_date": kwargs.get("meal_date"),
-            "meal_type": kwargs.get("meal_type"),
-            "meal_name": kwargs.get("meal_name"),
-            "calories": kwargs.get("calories", 0),
-            "protein_g": kwargs.get("protein_g", 0),
-            "carbs_g": kwargs.get("carbs_g", 0),
-            "fat_g": kwargs.get("fat_g", 0),
-            "notes": kwargs.get("notes")
-        }
-        # Remove None values except for numeric defaults
-        meal_data = {k: v for k, v in meal_data.items() if v is not None}
+        return _post("/nutrition/", _encode_payload(_MEAL_FIELDS, kwargs, _MEAL_DEFAULTS))
     return _post("/nutrition/", meal_data)
 
 
@@ -341,10 +499,7 @@ def get_daily_nutrition(target_date: str, user_id: int = 1) -> Optional[Dict]:
 
 def get_sleep_records(user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> Optional[List[Dict]]:
     """Fetch all sleep records with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if user_id:
-        params["user_id"] = user_id
-    return _get("/sleep/", params)
+    return _cached_get("/sleep/", _params(skip=skip, limit=limit, user_id=user_id))
 
 
 def get_sleep_record(sleep_id: int) -> Optional[Dict]:
@@ -352,20 +507,22 @@ def get_sleep_record(sleep_id: int) -> Optional[Dict]:
     return _get(f"/sleep/{sleep_id}")
 
 
+# Fields accepted by create_sleep_record(**kwargs)
+_SLEEP_FIELDS = (
+    "user_id",
+    "sleep_date",
+    "bed_time",
+    "wake_time",
+    "total_hours",
+    "sleep_quality",
+    "notes",
+)
+
+
 def create_sleep_record(sleep_data: Dict = None, **kwargs) -> Optional[Dict]:
     """Create a new sleep record. Accepts dict or keyword arguments."""
     if sleep_data is None:
-        sleep_data = {
-            "user_id": kwargs.get("user_id"),
-            "sleep_date": kwargs.get("sleep_date"),
-            "bed_time": kwargs.get("bed_time"),
-            "wake_time": kwargs.get("wake_time"),
-            "total_hours": kwargs.get("total_hours"),
-            "sleep_quality": kwargs.get("sleep_quality"),
-            "notes": kwargs.get("notes")
-        }
-        # Remove None values
-        sleep_data = {k: v for k, v in sleep_data.items() if v is not None}
+        return _post("/sleep/", _encode_payload(_SLEEP_FIELDS, kwargs))
     return _post("/sleep/", sleep_data)
 
 
@@ -381,7 +538,7 @@ def delete_sleep_record(sleep_id: int) -> bool:
 
 def get_average_sleep(user_id: int = 1) -> Optional[Dict]:
     """Fetch average sleep statistics."""
-    return _get("/sleep/average/", {"user_id": user_id})
+    return _cached_get("/sleep/average/", {"user_id": user_id}, ttl=AGGREGATE_CACHE_TTL)
 
 
 # ============================================================
@@ -390,10 +547,7 @@ def get_average_sleep(user_id: int = 1) -> Optional[Dict]:
 
 def get_water_intakes(user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> Optional[List[Dict]]:
     """Fetch all water intake records with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if user_id:
-        params["user_id"] = user_id
-    return _get("/water/", params)
+    return _cached_get("/water/", _params(skip=skip, limit=limit, user_id=user_id))
 
 
 def get_water_intake(water_id: int) -> Optional[Dict]:
@@ -401,18 +555,21 @@ def get_water_intake(water_id: int) -> Optional[Dict]:
     return _get(f"/water/{water_id}")
 
 
+# Fields accepted by create_water_intake(**kwargs)
+_WATER_FIELDS = (
+    "user_id",
+    "intake_date",
+    "intake_time",
+    "amount_ml",
+    "beverage_type",
+)
+_WATER_DEFAULTS = {"beverage_type": "water"}
+
+
 def create_water_intake(water_data: Dict = None, **kwargs) -> Optional[Dict]:
     """Create a new water intake record. Accepts dict or keyword arguments."""
     if water_data is None:
-        water_data = {
-            "user_id": kwargs.get("user_id"),
-            "intake_date": kwargs.get("intake_date"),
-            "intake_time": kwargs.get("intake_time"),
-            "amount_ml": kwargs.get("amount_ml"),
-            "beverage_type": kwargs.get("beverage_type", "water")
-        }
-        # Remove None values
-        water_data = {k: v for k, v in water_data.items() if v is not None}
+        return _post("/water/", _encode_payload(_WATER_FIELDS, kwargs, _WATER_DEFAULTS))
     return _post("/water/", water_data)
 
 
@@ -437,10 +594,7 @@ def get_daily_water(target_date: str, user_id: int = 1) -> Optional[Dict]:
 
 def get_weight_logs(user_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> Optional[List[Dict]]:
     """Fetch all weight logs with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if user_id:
-        params["user_id"] = user_id
-    return _get("/weight/", params)
+    return _cached_get("/weight/", _params(skip=skip, limit=limit, user_id=user_id))
 
 
 def get_weight_log(weight_id: int) -> Optional[Dict]:
@@ -448,19 +602,21 @@ def get_weight_log(weight_id: int) -> Optional[Dict]:
     return _get(f"/weight/{weight_id}")
 
 
+# Fields accepted by create_weight_log(**kwargs)
+_WEIGHT_FIELDS = (
+    "user_id",
+    "log_date",
+    "weight_kg",
+    "body_fat_percentage",
+    "bmi",
+    "notes",
+)
+
+
 def create_weight_log(weight_data: Dict = None, **kwargs) -> Optional[Dict]:
     """Create a new weight log. Accepts dict or keyword arguments."""
     if weight_data is None:
-        weight_data = {
-            "user_id": kwargs.get("user_id"),
-            "log_date": kwargs.get("log_date"),
-            "weight_kg": kwargs.get("weight_kg"),
-            "body_fat_percentage": kwargs.get("body_fat_percentage"),
-            "bmi": kwargs.get("bmi"),
-            "notes": kwargs.get("notes")
-        }
-        # Remove None values
-        weight_data = {k: v for k, v in weight_data.items() if v is not None}
+        return _post("/weight/", _encode_payload(_WEIGHT_FIELDS, kwargs))
     return _post("/weight/", weight_data)
 
 
@@ -476,7 +632,7 @@ def delete_weight_log(weight_id: int) -> bool:
 
 def get_weight_trend(user_id: int = 1) -> Optional[Dict]:
     """Fetch weight trend data for charts."""
-    return _get("/weight/trend/", {"user_id": user_id})
+    return _cached_get("/weight/trend/", {"user_id": user_id}, ttl=AGGREGATE_CACHE_TTL)
 
 
 # ============================================================
@@ -486,26 +642,20 @@ def get_weight_trend(user_id: int = 1) -> Optional[Dict]:
 def get_activity_logs(skip: int = 0, limit: int = 100, action_type: str = None, 
                       entity_type: str = None, user_id: int = None, hours: int = None) -> Optional[List[Dict]]:
     """Fetch activity logs with optional filtering."""
-    params = {"skip": skip, "limit": limit}
-    if action_type:
-        params["action_type"] = action_type
-    if entity_type:
-        params["entity_type"] = entity_type
-    if user_id:
-        params["user_id"] = user_id
-    if hours:
-        params["hours"] = hours
-    return _get("/activity/", params)
+    return _get("/activity/", _params(
+        skip=skip, limit=limit, action_type=action_type,
+        entity_type=entity_type, user_id=user_id, hours=hours
+    ))
 
 
 def get_recent_activity(limit: int = 20) -> Optional[List[Dict]]:
     """Fetch recent activity logs."""
-    return _get("/activity/recent", {"limit": limit})
+    return _cached_get("/activity/recent", {"limit": limit}, ttl=AGGREGATE_CACHE_TTL)
 
 
 def get_activity_stats() -> Optional[Dict]:
     """Fetch activity statistics."""
-    return _get("/activity/stats")
+    return _cached_get("/activity/stats", ttl=AGGREGATE_CACHE_TTL)
 
 
 def log_activity(user_id: int, username: str, action_type: str, entity_type: str,
@@ -545,12 +695,19 @@ def get_user_health_data(user_id: int, start_date: Optional[str] = None,
     Get all health data for a specific user with optional date filtering.
     Returns workouts, meals, sleep, water, weight data.
     """
-    params = {}
-    if start_date:
-        params["start_date"] = start_date
-    if end_date:
-        params["end_date"] = end_date
-    return _get(f"/search/user/{user_id}/data", params if params else None)
+    return _get(
+        f"/search/user/{user_id}/data",
+        _params(start_date=start_date, end_date=end_date) or None
+    )
+
+
+def get_user_health_summary(user_id: int, limit: int = 5) -> Optional[Dict]:
+    """
+    Get a compact health data summary for a specific user.
+    Returns the latest `limit` records per category, total counts,
+    and pre-aggregated chart data.
+    """
+    return _get(f"/search/user/{user_id}/summary", {"limit": limit})
 
 
 # ============================================================
@@ -558,9 +715,39 @@ def get_user_health_data(user_id: int, start_date: Optional[str] = None,
 # ============================================================
 
 def check_backend_health() -> bool:
-    """Check if the backend API is running."""
+    """Check if the backend API is running (HEAD probe, no body transferred)."""
     try:
-        response = requests.get(f"{API_BASE_URL.replace('/api', '')}/", timeout=5)
-        return response.status_code == 200
-    except requests.exceptions.ConnectionError:
+        response = _probe_session.head(_HEALTH_URL, timeout=_HEALTH_TIMEOUT, allow_redirects=False)
+        return response.status_code < 500
+    except requests.exceptions.RequestException:
         return False
+
+
+WARMUP_CONNECTIONS = 4  # keep-alive sockets opened ahead of the first user
+
+
+def _open_pooled_connection() -> None:
+    """HEAD the backend root over the pooled session, leaving the socket in the pool."""
+    try:
+        _session.head(_HEALTH_URL, timeout=_HEALTH_TIMEOUT, allow_redirects=False)
+    except requests.exceptions.RequestException:
+        pass
+
+
+def warm_connection_pool() -> None:
+    """
+    Open keep-alive connections to the backend ahead of the first user.
+    
+    Sends a few concurrent HEAD requests to the health route over the pooled
+    session; the API is on the same host and port, so the first dashboard
+    callbacks reuse those sockets. Does nothing if the backend is down.
+    """
+    if check_backend_health():
+        fetch_concurrently({n: _open_pooled_connection for n in range(WARMUP_CONNECTIONS)})
+
+
+def start_pool_warmup() -> threading.Thread:
+    """Warm the connection pool on a background daemon thread."""
+    thread = threading.Thread(target=warm_connection_pool, name="api-pool-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -48,6 +48,10 @@ def main():
     print("🏃 Health & Fitness Monitor - Starting Servers")
     print("=" * 60)
     
+    # Both children inherit this terminal's stdout/stderr. Don't switch them
+    # to subprocess.PIPE without draining it: once the pipe buffer fills, the
+    # servers block on their next log write.
+    
     # Start Backend
     print("\n📦 Starting Backend (FastAPI)...")
     backend_process = subprocess.Popen(